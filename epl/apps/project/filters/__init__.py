@@ -1,6 +1,11 @@
 from uuid import UUID
 
 UUID_REGEX = "^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"
+UUID_SCHEMA = {
+    "type": "string",
+    "format": "uuid",
+    "pattern": UUID_REGEX,
+}
 
 
 class QueryParamMixin:
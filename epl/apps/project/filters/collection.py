@@ -1,6 +1,12 @@
+import copy
+import functools
+
+from django.utils.translation import get_language
 from django.utils.translation import gettext_lazy as _
 from rest_framework import filters
 
+from epl.apps.project.filters import UUID_SCHEMA
+
 
 class CollectionFilter(filters.BaseFilterBackend):
     """
@@ -20,27 +26,26 @@ class CollectionFilter(filters.BaseFilterBackend):
         return queryset
 
     def get_schema_operation_parameters(self, view):
-        return [
+        # The cached parameters are shared by every call, hand out copies the caller can modify
+        return copy.deepcopy(list(self._get_schema_operation_parameters(get_language())))
+
+    @classmethod
+    @functools.cache
+    def _get_schema_operation_parameters(cls, language: str | None) -> tuple[dict, ...]:
+        # Resolve the lazy descriptions once per language
+        return (
             {
-                "name": self.project_param,
+                "name": cls.project_param,
                 "required": False,
                 "in": "query",
-                "description": str(self.project_param_description),
-                "schema": {
-                    "type": "string",
-                    "format": "uuid",
-                    "pattern": "^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
-                },
+                "description": str(cls.project_param_description),
+                "schema": UUID_SCHEMA,
             },
             {
-                "name": self.library_param,
+                "name": cls.library_param,
                 "required": False,
                 "in": "query",
-                "description": str(self.library_param_description),
-                "schema": {
-                    "type": "string",
-                    "format": "uuid",
-                    "pattern": "^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
-                },
+                "description": str(cls.library_param_description),
+                "schema": UUID_SCHEMA,
             },
-        ]
+        )
@@ -1,14 +1,64 @@
-from django.core.exceptions import ValidationError as DjangoValidationError
+import copy
+import functools
+from uuid import UUID
+
 from django.db.models import Exists, IntegerChoices, OuterRef, Q
+from django.utils.translation import get_language
 from django.utils.translation import gettext_lazy as _
 from rest_framework import filters
 from rest_framework.exceptions import ValidationError
 from rest_framework.request import Request
 
-from epl.apps.project.filters import UUID_REGEX
-from epl.apps.project.models import Library, Project, Resource, ResourceStatus
+from epl.apps.project.filters import UUID_SCHEMA
+from epl.apps.project.models import Collection, Library, ResourceStatus, Segment
 from epl.apps.project.models.collection import Arbitration
 
+VALID_RESOURCE_STATUSES = frozenset(ResourceStatus.values)
+
+
+def _first_turn_library_q(copies: str, library_id: UUID) -> Q:
+    """
+    Matches resources whose next turn in the given copies belongs to the library.
+    The containment condition can be served by the GIN index on instruction_turns,
+    the path lookup then ensures the library's turn is the first one.
+    """
+    library_id = str(library_id)
+    return Q(
+        instruction_turns__contains={copies: {"turns": [{"library": library_id}]}},
+        **{f"instruction_turns__{copies}__turns__0__library": library_id},
+    )
+
+
+def _status_q(status: int, library_id: UUID | None = None) -> Q:
+    return Q(status=status)
+
+
+def _positioning_q(status: int, library_id: UUID | None = None) -> Q:
+    # Resources without any segment are still being positioned, whatever their status
+    return Q(status=status) | ~Exists(Segment.objects.filter(collection__resource=OuterRef("id")))
+
+
+def _instruction_bound_q(status: int, library_id: UUID | None = None) -> Q:
+    q = Q(status=status, arbitration=Arbitration.NONE)
+    if library_id:
+        q &= _first_turn_library_q("bound_copies", library_id)
+    return q
+
+
+def _instruction_unbound_q(status: int, library_id: UUID | None = None) -> Q:
+    q = Q(status=status)
+    if library_id:
+        q &= _first_turn_library_q("unbound_copies", library_id)
+    return q
+
+
+# Builds the condition matching a requested status, optionally restricted to the library whose turn it is
+STATUS_FILTERS = {
+    ResourceStatus.POSITIONING: _positioning_q,
+    ResourceStatus.INSTRUCTION_BOUND: _instruction_bound_q,
+    ResourceStatus.INSTRUCTION_UNBOUND: _instruction_unbound_q,
+}
+
 
 class PositioningFilter(IntegerChoices):
     ALL = 0, _("All")
@@ -32,15 +82,15 @@ class ResourceFilter(filters.BaseFilterBackend):
     positioning_filter_description = "Filter by positioning filter available"
 
     def filter_queryset(self, request, queryset, view):
-        if view.action != "list":
+        # Views without actions (or non-list actions) don't use these query params
+        if getattr(view, "action", None) != "list":
             return queryset
 
         statuses = self._validate_status(request)
-        library = self._get_library(request)
-        against_library = self._get_against_library(request)
+        library_id, against_library_id = self._get_libraries(request)
 
         queryset = self._apply_project_filter(request, queryset)
-        queryset = self._apply_library_filter(queryset, statuses, library, against_library)
+        queryset = self._apply_library_filter(queryset, statuses, library_id, against_library_id)
         queryset = self._apply_positioning_filter(request, queryset)
         queryset = self._apply_arbitration_filter(request, queryset)
 
@@ -54,46 +104,66 @@ class ResourceFilter(filters.BaseFilterBackend):
         except (ValueError, TypeError):
             raise ValidationError({"status": _("Invalid status value")})
 
-        for s in statuses:
-            if s not in ResourceStatus:
-                raise ValidationError({"status": _("Invalid status value")})
+        if not VALID_RESOURCE_STATUSES.issuperset(statuses):
+            raise ValidationError({"status": _("Invalid status value")})
         return statuses
 
     @staticmethod
-    def _get_library_param(request: Request, param_name: str, error_message) -> Library | None:
-        library_id = request.query_params.get(param_name, None)
-        if not library_id:
+    def _get_uuid_param(request: Request, param_name: str, error_message) -> UUID | None:
+        value = request.query_params.get(param_name, None)
+        if not value:
             return None
         try:
-            return Library.objects.get(id=library_id)
-        except (Library.DoesNotExist, DjangoValidationError):
+            return UUID(value)
+        except ValueError:
             raise ValidationError({param_name: error_message})
 
-    def _get_library(self, request) -> Library | None:
-        return self._get_library_param(request, self.library_param, _("Library not found"))
-
-    def _get_against_library(self, request) -> Library | None:
-        return self._get_library_param(request, self.against_param, _("Library to compare against not found"))
+    @staticmethod
+    def _get_existing_library_ids(request: Request, library_ids: set[UUID]) -> set[UUID]:
+        """
+        Returns the ids among library_ids that exist in the database.
+        The ids already found are remembered on the request, the filter can run several times per request.
+        """
+        known_ids = request.__dict__.setdefault("_existing_library_ids", set())
+        if missing_ids := library_ids - known_ids:
+            known_ids.update(Library.objects.filter(id__in=missing_ids).values_list("id", flat=True))
+        return library_ids & known_ids
+
+    def _get_libraries(self, request) -> tuple[UUID | None, UUID | None]:
+        """
+        Returns the ids of the library and of the library to compare against.
+        Both ids are checked for existence with a single query.
+        """
+        library_id = self._get_uuid_param(request, self.library_param, _("Library not found"))
+        against_id = self._get_uuid_param(request, self.against_param, _("Library to compare against not found"))
+
+        existing_ids = self._get_existing_library_ids(request, {_id for _id in (library_id, against_id) if _id})
+        if library_id and library_id not in existing_ids:
+            raise ValidationError({self.library_param: _("Library not found")})
+        if against_id and against_id not in existing_ids:
+            raise ValidationError({self.against_param: _("Library to compare against not found")})
+        return library_id, against_id
 
     def _apply_project_filter(self, request, queryset):
-        project_id = request.query_params.get(self.project_param, None)
+        # An unknown project simply yields an empty queryset, only malformed ids are rejected
+        project_id = self._get_uuid_param(request, self.project_param, _("Project not found"))
         if not project_id:
             return queryset
-        try:
-            project = Project.objects.get(id=project_id)
-            return queryset.filter(project=project)
-        except (Project.DoesNotExist, DjangoValidationError):
-            raise ValidationError({"project": _("Project not found")})
+        return queryset.filter(project_id=project_id)
 
-    def _apply_library_filter(self, queryset, statuses, library, against_library):
-        if not library:
+    def _apply_library_filter(self, queryset, statuses, library_id, against_library_id):
+        if not library_id:
             return self.filter_no_library(queryset, statuses)
-        return self.filter_for_library(queryset, statuses, library, against_library)
+        return self.filter_for_library(queryset, statuses, library_id, against_library_id)
 
     def _apply_positioning_filter(self, request, queryset):
-        positioning_filter_value = int(request.query_params.get(self.positioning_filter_param, 0))
+        positioning_filter_value = request.query_params.get(self.positioning_filter_param, "")
         if not positioning_filter_value:
             return queryset
+        try:
+            positioning_filter_value = int(positioning_filter_value)
+        except ValueError:
+            raise ValidationError({self.positioning_filter_param: _("Invalid positioning filter value")})
 
         if positioning_filter_value == PositioningFilter.POSITIONING_ONLY:
             return queryset.filter(status=ResourceStatus.POSITIONING, arbitration=Arbitration.NONE)
@@ -118,49 +188,31 @@ class ResourceFilter(filters.BaseFilterBackend):
         else:
             raise ValidationError({"arbitration": _("Invalid arbitration param, must be '0', '1' or 'all'")})
 
-    def _get_segments_annotation(self):
-        return Exists(Resource.objects.filter(id=OuterRef("id"), collections__segments__isnull=False))
+    @staticmethod
+    def _get_library_annotation(library_id: UUID):
+        return Exists(Collection.objects.filter(resource=OuterRef("id"), library_id=library_id))
+
+    @staticmethod
+    def _get_statuses_q(statuses, library_id: UUID | None = None) -> Q:
+        combined_q = Q()
+        for s in statuses:
+            combined_q |= STATUS_FILTERS.get(s, _status_q)(s, library_id)
+        return combined_q
 
-    def filter_for_library(self, queryset, statuses, library, against_library=None):
+    def filter_for_library(self, queryset, statuses, library_id: UUID, against_library_id: UUID | None = None):
         # Ensure list
         if not isinstance(statuses, (list, tuple)):
             statuses = [statuses]
 
-        need_has_segments = ResourceStatus.POSITIONING in statuses
-        if need_has_segments:
-            queryset = queryset.annotate(has_segments=self._get_segments_annotation())
-
-        combined_q = Q()
-        for s in statuses:
-            if s == ResourceStatus.POSITIONING:
-                combined_q |= Q(status=s, collections__library=library) | Q(
-                    has_segments=False,
-                    collections__library=library,
-                )
-            elif s == ResourceStatus.INSTRUCTION_BOUND:
-                combined_q |= Q(
-                    status=s,
-                    collections__library=library,
-                    instruction_turns__bound_copies__turns__0__library=str(library.id),
-                    arbitration=Arbitration.NONE,
-                )
-            elif s == ResourceStatus.INSTRUCTION_UNBOUND:
-                combined_q |= Q(
-                    status=s,
-                    collections__library=library,
-                    instruction_turns__unbound_copies__turns__0__library=str(library.id),
-                )
-            elif s in [ResourceStatus.CONTROL_BOUND, ResourceStatus.CONTROL_UNBOUND]:
-                combined_q |= Q(status=s, collections__library=library)
-            else:
-                # fallback to require collection membership for other statuses
-                combined_q |= Q(status=s, collections__library=library)
+        # Collection membership is checked with semi-joins: joining on collections would multiply the rows
+        # (and the aggregates computed by the view), and a second join is needed to compare against another library.
+        queryset = queryset.filter(self._get_library_annotation(library_id))
+        if against_library_id and against_library_id != library_id:
+            queryset = queryset.filter(self._get_library_annotation(against_library_id))
 
+        combined_q = self._get_statuses_q(statuses, library_id)
         if combined_q:
-            queryset = queryset.filter(combined_q).distinct()
-
-        if against_library:
-            queryset = queryset.filter(collections__library=against_library)
+            queryset = queryset.filter(combined_q)
 
         return queryset
 
@@ -168,64 +220,48 @@ class ResourceFilter(filters.BaseFilterBackend):
         if not isinstance(statuses, (list, tuple)):
             statuses = [statuses]
 
-        need_has_segments = ResourceStatus.POSITIONING in statuses
-        if need_has_segments:
-            queryset = queryset.annotate(has_segments=self._get_segments_annotation())
-
-        combined_q = Q()
-        for s in statuses:
-            if s == ResourceStatus.POSITIONING:
-                combined_q |= Q(status=s) | Q(has_segments=False)
-            elif s == ResourceStatus.INSTRUCTION_BOUND:
-                combined_q |= Q(status=s, arbitration=Arbitration.NONE)
-            elif s > ResourceStatus.POSITIONING:
-                combined_q |= Q(status=s)
+        combined_q = self._get_statuses_q(statuses)
 
         if combined_q:
-            queryset = queryset.filter(combined_q).distinct()
+            queryset = queryset.filter(combined_q)
 
         return queryset
 
     def get_schema_operation_parameters(self, view):
-        return [
+        # The cached parameters are shared by every call, hand out copies the caller can modify
+        return copy.deepcopy(list(self._get_schema_operation_parameters(get_language())))
+
+    @classmethod
+    @functools.cache
+    def _get_schema_operation_parameters(cls, language: str | None) -> tuple[dict, ...]:
+        # The parameters only depend on the active language, build them once per language
+        return (
             {
-                "name": self.project_param,
+                "name": cls.project_param,
                 "required": True,
                 "in": "query",
-                "description": str(self.project_param_description),
-                "schema": {
-                    "type": "string",
-                    "format": "uuid",
-                    "pattern": UUID_REGEX,
-                },
+                "description": str(cls.project_param_description),
+                "schema": UUID_SCHEMA,
             },
             {
-                "name": self.library_param,
+                "name": cls.library_param,
                 "required": False,
                 "in": "query",
-                "description": str(self.library_param_description),
-                "schema": {
-                    "type": "string",
-                    "format": "uuid",
-                    "pattern": UUID_REGEX,
-                },
+                "description": str(cls.library_param_description),
+                "schema": UUID_SCHEMA,
             },
             {
-                "name": self.against_param,
+                "name": cls.against_param,
                 "required": False,
                 "in": "query",
-                "description": str(self.against_param_description),
-                "schema": {
-                    "type": "string",
-                    "format": "uuid",
-                    "pattern": UUID_REGEX,
-                },
+                "description": str(cls.against_param_description),
+                "schema": UUID_SCHEMA,
             },
             {
-                "name": self.status_param,
+                "name": cls.status_param,
                 "required": True,
                 "in": "query",
-                "description": str(self.status_param_description)
+                "description": str(cls.status_param_description)
                 + "<br/>"
                 + "<br/>".join([f"{_val}: {_label}" for _val, _label in ResourceStatus.choices]),
                 "schema": {
@@ -237,27 +273,27 @@ class ResourceFilter(filters.BaseFilterBackend):
                 },
             },
             {
-                "name": self.arbitration_param,
+                "name": cls.arbitration_param,
                 "required": False,
                 "in": "query",
-                "description": str(self.arbitration_param_description),
+                "description": str(cls.arbitration_param_description),
                 "schema": {
                     "type": "string",
                     "enum": ["0", "1", "all"],
-                    "description": _(
-                        "'0' for arbitration type 0, '1' for arbitration type 1, 'all' for all arbitration types"
+                    "description": str(
+                        _("'0' for arbitration type 0, '1' for arbitration type 1, 'all' for all arbitration types")
                     ),
                 },
             },
             {
-                "name": self.positioning_filter_param,
+                "name": cls.positioning_filter_param,
                 "required": False,
                 "in": "query",
-                "description": str(self.positioning_filter_description),
+                "description": str(cls.positioning_filter_description),
                 "schema": {
                     "type": "integer",
                     "enum": [_p[0] for _p in PositioningFilter.choices],
-                    "description": _("'10' for Positioning only, '20' for Instruction not start"),
+                    "description": str(_("'10' for Positioning only, '20' for Instruction not start")),
                 },
             },
-        ]
+        )
@@ -1,8 +1,11 @@
 import datetime
-import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Annotated
 
 import typer
+from django.core.management import CommandError
+from django.db import connection
+from django.db.models import Count, QuerySet
 from django.utils import timezone
 from django_tenants.utils import schema_context
 from django_typer.management import TyperCommand
@@ -10,23 +13,27 @@ from django_typer.management import TyperCommand
 from epl.apps.project.models import ActionLog
 from epl.apps.tenant.models import Consortium
 
+PURGE_BATCH_SIZE = 10_000
+MAX_WORKERS = 8
+
 
 class Command(TyperCommand):
     @staticmethod
     def parse_duration(value) -> datetime.timedelta | None:
-        m = re.match(r"^(\d+)([DMYW])$", value)
-        if not m:
+        # <digits><unit>, e.g. 30D or 12M
+        number, unit = value[:-1], value[-1:]
+        if not (number.isascii() and number.isdigit()):
             return None
 
-        match m[2]:
+        match unit:
             case "D":
-                return datetime.timedelta(days=int(m[1]))
+                return datetime.timedelta(days=int(number))
             case "W":
-                return datetime.timedelta(weeks=int(m[1]))
+                return datetime.timedelta(weeks=int(number))
             case "M":
-                return datetime.timedelta(days=int(m[1]) * 30)
+                return datetime.timedelta(days=int(number) * 30)
             case "Y":
-                return datetime.timedelta(days=int(m[1]) * 365)
+                return datetime.timedelta(days=int(number) * 365)
             case _:
                 return None
 
@@ -41,6 +48,10 @@ class Command(TyperCommand):
             bool,
             typer.Option(help="If set, only count the logs that would be deleted without actually deleting them"),
         ] = False,
+        workers: Annotated[
+            int,
+            typer.Option(help="Maximum number of schemas purged concurrently", min=1),
+        ] = MAX_WORKERS,
     ):
         """
         Purge logs older than the specified duration.
@@ -50,9 +61,10 @@ class Command(TyperCommand):
         Optionally specify a schema to target a specific tenant, by default all tenants' logs are purged.
         """
 
-        now = timezone.now()
         delta = self.parse_duration(older_than)
-        cutoff_date = now - delta
+        if delta is None:
+            raise CommandError(f"Invalid duration: {older_than}")
+        cutoff_date = timezone.now() - delta
 
         self.secho(f"> Purging logs older than {cutoff_date} for schema: {schema or 'all'}", fg="green", bold=True)
 
@@ -61,19 +73,66 @@ class Command(TyperCommand):
         else:
             schemas = [schema]
 
-        for s in schemas:
-            self.purge_schema(s, cutoff_date, dry_run)
+        workers = min(workers, len(schemas))
+        if workers <= 1:
+            for s in schemas:
+                self.purge_schema(s, cutoff_date, dry_run)
+            return
+
+        # Each schema is purged independently: overlap the database round-trips of several tenants
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for future in [executor.submit(self.purge_schema_in_thread, s, cutoff_date, dry_run) for s in schemas]:
+                future.result()
 
     @staticmethod
     def get_schemas() -> list[str]:
-        return [consortium.schema_name for consortium in Consortium.objects.all()]
+        return list(Consortium.objects.values_list("schema_name", flat=True))
+
+    def purge_schema_in_thread(self, schema: str, cutoff_date: datetime.datetime, dry_run: bool = False) -> int:
+        try:
+            return self.purge_schema(schema, cutoff_date, dry_run)
+        finally:
+            # Database connections are opened per thread, they have to be closed by the thread itself
+            connection.close()
+
+    @staticmethod
+    def delete_in_batches(queryset: QuerySet, batch_size: int = PURGE_BATCH_SIZE) -> int:
+        """
+        Delete the rows of the queryset by batches of primary keys.
+
+        Log entries have no dependent rows and no signal receivers, so the rows are deleted
+        with raw DELETE statements instead of going through the deletion collector.
+        Short statements avoid holding locks on the whole table during a large purge.
+        """
+        deleted_count = 0
+        while batch := list(queryset.order_by().values_list("pk", flat=True)[:batch_size]):
+            deleted_count += queryset.model.objects.filter(pk__in=batch)._raw_delete(using=queryset.db)
+        return deleted_count
+
+    def report_counts_by_type(self, schema: str, queryset: QuerySet) -> int:
+        """
+        Print the number of log entries per type of logged object and return the total.
+        The entries are grouped by the database, only one row per type is sent back.
+        """
+        counts = (
+            queryset.order_by()
+            .values_list("content_type__app_label", "content_type__model")
+            .annotate(count=Count("id"))
+            .order_by("content_type__app_label", "content_type__model")
+        )
+        total = 0
+        for app_label, model, count in counts:
+            self.secho(f"   {schema}: {count} log entries on {app_label or '-'}.{model or '-'}")
+            total += count
+        return total
 
     def purge_schema(self, schema: str, cutoff_date: datetime.datetime, dry_run: bool = False) -> int:
         with schema_context(schema):
+            logs = ActionLog.objects.filter(action_time__lt=cutoff_date)
             if dry_run:
-                deleted_count = ActionLog.objects.filter(action_time__lt=cutoff_date).count()
+                deleted_count = self.report_counts_by_type(schema, logs)
             else:
-                deleted_count, _ = ActionLog.objects.filter(action_time__lt=cutoff_date).delete()
+                deleted_count = self.delete_in_batches(logs)
             self.secho(
                 f"🗑️ {schema}: Purged {deleted_count} log entries older than {cutoff_date:%Y-%m-%d %H:%M:%S%z}",
                 bold=True,
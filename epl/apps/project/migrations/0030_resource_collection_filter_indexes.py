@@ -0,0 +1,83 @@
+# Generated by Django 5.2.12 on 2026-10-17 07:39
+
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("project", "0029_alter_resource_title"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="collection",
+            name="library",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="collections",
+                to="project.library",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="collection",
+            name="project",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="collections",
+                to="project.project",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="collection",
+            name="resource",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="collections",
+                to="project.resource",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="collection",
+            index=models.Index(
+                fields=["resource", "library"],
+                include=("position",),
+                name="collection_resource_lib_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="collection",
+            index=models.Index(
+                fields=["library", "resource"],
+                name="collection_lib_resource_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="collection",
+            index=models.Index(
+                fields=["project", "library"],
+                include=("position",),
+                name="collection_proj_lib_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="resource",
+            index=models.Index(
+                fields=["project", "status", "arbitration"],
+                name="resource_proj_status_arb_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="resource",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["instruction_turns"],
+                name="resource_instruction_turns_gin",
+                opclasses=["jsonb_path_ops"],
+            ),
+        ),
+    ]
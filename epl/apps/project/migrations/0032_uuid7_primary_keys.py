@@ -0,0 +1,104 @@
+# Generated by Django 5.2.12 on 2026-10-17 08:02
+
+import epl.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("project", "0030_resource_collection_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="actionlog",
+            name="id",
+            field=models.UUIDField(
+                default=epl.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="anomaly",
+            name="id",
+            field=models.UUIDField(
+                default=epl.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="collection",
+            name="id",
+            field=models.UUIDField(
+                default=epl.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="comment",
+            name="id",
+            field=models.UUIDField(
+                default=epl.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="library",
+            name="id",
+            field=models.UUIDField(
+                default=epl.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="project",
+            name="id",
+            field=models.UUIDField(
+                default=epl.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="resource",
+            name="id",
+            field=models.UUIDField(
+                default=epl.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="segment",
+            name="id",
+            field=models.UUIDField(
+                default=epl.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="userrole",
+            name="id",
+            field=models.UUIDField(
+                default=epl.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.12 on 2026-10-17 08:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("project", "0032_uuid7_primary_keys"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="actionlog",
+            index=models.Index(
+                fields=["content_type", "object_id"],
+                name="project_act_content_d81f18_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="comment",
+            index=models.Index(
+                fields=["content_type", "object_id"],
+                name="project_com_content_e22fca_idx",
+            ),
+        ),
+    ]
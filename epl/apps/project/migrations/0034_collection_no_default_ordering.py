@@ -0,0 +1,20 @@
+# Generated by Django 5.2.12 on 2026-10-17 08:23
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("project", "0033_generic_relation_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="collection",
+            options={
+                "verbose_name": "Collection",
+                "verbose_name_plural": "Collections",
+            },
+        ),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 5.2.12 on 2026-10-17 08:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("project", "0034_collection_no_default_ordering"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="collection",
+            name="position",
+            field=models.PositiveSmallIntegerField(
+                blank=True,
+                choices=[
+                    (1, "Position 1"),
+                    (2, "Position 2"),
+                    (3, "Position 3"),
+                    (4, "Position 4"),
+                    (0, "Position excluded"),
+                ],
+                help_text="Positioning rank of a collection",
+                null=True,
+                verbose_name="Position",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="resource",
+            name="arbitration",
+            field=models.PositiveSmallIntegerField(
+                choices=[
+                    (0, "Arbitration Type 0"),
+                    (1, "Arbitration Type 1"),
+                    (2, "No arbitration"),
+                ],
+                db_index=True,
+                default=2,
+                verbose_name="Arbitration",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="resource",
+            name="status",
+            field=models.PositiveSmallIntegerField(
+                choices=[
+                    (10, "Positioning"),
+                    (15, "Excluded"),
+                    (20, "Instruction Bound Copies"),
+                    (25, "Anomaly Bound Copies"),
+                    (30, "Control Bound Copies"),
+                    (40, "Instruction Unbound Copies"),
+                    (45, "Anomaly Unbound Copies"),
+                    (50, "Control Unbound Copies"),
+                    (60, "Edition"),
+                ],
+                default=10,
+                verbose_name="Status",
+            ),
+        ),
+    ]
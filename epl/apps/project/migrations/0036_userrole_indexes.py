@@ -0,0 +1,24 @@
+# Generated by Django 5.2.12 on 2026-10-17 08:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("project", "0035_small_integer_status_fields"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="userrole",
+            index=models.Index(
+                fields=["user"],
+                include=("project", "library", "role"),
+                name="userrole_user_covering_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="userrole",
+            index=models.Index(fields=["project", "role"], name="userrole_project_role_idx"),
+        ),
+    ]
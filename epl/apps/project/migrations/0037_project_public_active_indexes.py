@@ -0,0 +1,28 @@
+# Generated by Django 5.2.12 on 2026-10-17 08:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("project", "0036_userrole_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                condition=models.Q(("is_private", False), ("status__gte", 40)),
+                fields=["active_after"],
+                name="project_public_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                condition=models.Q(("status__gte", 40), ("status__lt", 100)),
+                fields=["active_after"],
+                name="project_active_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.12 on 2026-10-17 09:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("project", "0037_project_public_active_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="segment",
+            index=models.Index(
+                condition=models.Q(("content", "~~Nihil~~")),
+                fields=["collection", "order"],
+                name="segment_nihil_order_idx",
+            ),
+        ),
+    ]
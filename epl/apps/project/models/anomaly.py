@@ -37,9 +37,7 @@ class Anomaly(models.Model):
         null=True,
     )
 
-    _extended_permissions = [
-        "fix",
-    ]
+    _extended_permissions = ("fix",)
 
     class Meta:
         verbose_name = _("Anomaly")
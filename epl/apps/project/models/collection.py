@@ -1,6 +1,7 @@
 from typing import TypedDict
 
 from django.contrib.contenttypes.fields import GenericRelation
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.utils.translation import gettext as _
 
@@ -11,6 +12,8 @@ from epl.validators import IssnValidator
 
 
 def default_instuction_turns():
+    # Every resource needs its own mutable containers: a literal is much cheaper
+    # than deep-copying a shared template
     return {
         "bound_copies": {
             "turns": [],
@@ -41,31 +44,45 @@ class TurnType(TypedDict):
     collection: str
 
 
+# Instruction turns sequence holding the next turn, by resource status
+NEXT_TURN_COPIES = {
+    ResourceStatus.INSTRUCTION_BOUND: "bound_copies",
+    ResourceStatus.ANOMALY_BOUND: "bound_copies",
+    ResourceStatus.INSTRUCTION_UNBOUND: "unbound_copies",
+    ResourceStatus.ANOMALY_UNBOUND: "unbound_copies",
+    ResourceStatus.CONTROL_BOUND: "unbound_copies",
+}
+
+
 class Resource(models.Model):
     id = UUIDPrimaryKeyField()
     code = models.CharField(_("Code (PPN or other)"), max_length=25, db_index=True)  # PPN
     issn = models.CharField(_("ISSN"), max_length=9, blank=True, validators=[IssnValidator()])
     title = models.CharField(_("Title"), max_length=2048, db_index=True)
     project = models.ForeignKey("Project", on_delete=models.CASCADE, related_name="resources")
-    status = models.IntegerField(_("Status"), choices=ResourceStatus.choices, default=ResourceStatus.POSITIONING)
+    status = models.PositiveSmallIntegerField(
+        _("Status"), choices=ResourceStatus.choices, default=ResourceStatus.POSITIONING
+    )
     instruction_turns = models.JSONField(_("Instruction turns"), default=default_instuction_turns, blank=True)
     publication_history = models.CharField(
         _("Publication history"), blank=True
     )  # Historique de la publication (todo absent des exemples)
     numbering = models.CharField(_("Numbering"), blank=True)  # Numérotation (todo absent des exemples)
-    arbitration = models.IntegerField(_("Arbitration"), choices=Arbitration, default=Arbitration.NONE, db_index=True)
+    arbitration = models.PositiveSmallIntegerField(
+        _("Arbitration"), choices=Arbitration, default=Arbitration.NONE, db_index=True
+    )
     created_at = models.DateTimeField(_("Created at"), auto_now_add=True)
     comments = GenericRelation(Comment)
     validations = models.JSONField(_("Validations"), default=dict, blank=True)
 
-    _extended_permissions = [
+    _extended_permissions = (
         "list_statuses",
         "collections",
         "validate_control",
         "report_anomalies",
         "reset_instruction",
         "reassign_instruction_turn",
-    ]
+    )
 
     class Meta:
         verbose_name = _("Resource")
@@ -74,6 +91,10 @@ class Resource(models.Model):
         constraints = [
             models.UniqueConstraint(fields=["code", "project"], name="unique_resource_code_per_project"),
         ]
+        indexes = [
+            models.Index(fields=["project", "status", "arbitration"], name="resource_proj_status_arb_idx"),
+            GinIndex(fields=["instruction_turns"], name="resource_instruction_turns_gin", opclasses=["jsonb_path_ops"]),
+        ]
 
     def __str__(self):
         return f"{self.code} - {self.project_id}"
@@ -87,19 +108,12 @@ class Resource(models.Model):
         Returns the next collection and library that should perform instruction
         based on the current resource status and instruction turns sequence.
         """
-        turn = None
-        try:
-            if self.status in [ResourceStatus.INSTRUCTION_BOUND, ResourceStatus.ANOMALY_BOUND]:
-                turn = self.instruction_turns.get("bound_copies", {}).get("turns", [])[0]
-            elif self.status in [
-                ResourceStatus.INSTRUCTION_UNBOUND,
-                ResourceStatus.ANOMALY_UNBOUND,
-                ResourceStatus.CONTROL_BOUND,
-            ]:
-                turn = self.instruction_turns.get("unbound_copies", {}).get("turns", [])[0]
-        except IndexError:
-            turn = None
-        if not isinstance(turn, dict) or (set(turn.keys()) != {"library", "collection"}):
+        copies = NEXT_TURN_COPIES.get(self.status)
+        if copies is None:
+            return None
+        turns = self.instruction_turns.get(copies, {}).get("turns", [])
+        turn = turns[0] if turns else None
+        if not isinstance(turn, dict) or (turn.keys() != {"library", "collection"}):
             turn = None
 
         return turn
@@ -111,18 +125,36 @@ class Resource(models.Model):
         return Segment.objects.filter(collection__resource=self)
 
     def calculate_turns(self) -> list[TurnType]:
-        collections = self.collections.filter(position__gt=0).order_by("position")
+        collections = self.collections.filter(position__gt=0).order_by("position").values_list("library_id", "id")
         turns: list[TurnType] = [
-            {"library": str(_collection.library_id), "collection": str(_collection.id)} for _collection in collections
+            {"library": str(_library_id), "collection": str(_collection_id)}
+            for _library_id, _collection_id in collections
         ]
         return turns
 
 
+class CollectionQuerySet(models.QuerySet):
+    def with_positioning_comments(self) -> models.QuerySet["Collection"]:
+        """
+        Prefetch the positioning comments, newest first, for latest_positioning_comment.
+        """
+        return self.prefetch_related(
+            models.Prefetch(
+                "comments",
+                queryset=Comment.objects.filter(subject=_("Positioning comment")).order_by("-created_at"),
+                to_attr="positioning_comments",
+            )
+        )
+
+
 class Collection(models.Model):
     id = UUIDPrimaryKeyField()
-    resource = models.ForeignKey("Resource", on_delete=models.CASCADE, related_name="collections")  # RCR
-    library = models.ForeignKey("Library", on_delete=models.CASCADE, related_name="collections")  # RCR
-    project = models.ForeignKey("Project", on_delete=models.CASCADE, related_name="collections")
+    # The composite indexes in Meta lead with resource, library and project, no single column index is needed
+    resource = models.ForeignKey(
+        "Resource", on_delete=models.CASCADE, related_name="collections", db_index=False
+    )  # RCR
+    library = models.ForeignKey("Library", on_delete=models.CASCADE, related_name="collections", db_index=False)  # RCR
+    project = models.ForeignKey("Project", on_delete=models.CASCADE, related_name="collections", db_index=False)
     call_number = models.CharField(_("Call number"), blank=True)  # Cote
     hold_statement = models.CharField(_("Hold statement"), blank=True)  # État de la collection
     missing = models.CharField(_("Missing"), blank=True)  # Lacunes
@@ -133,7 +165,7 @@ class Collection(models.Model):
     alias = models.CharField(
         "Alias", max_length=255, blank=True, help_text=_("Alias for a duplicate collection in the same library")
     )
-    position = models.IntegerField(
+    position = models.PositiveSmallIntegerField(
         _("Position"), choices=Position, null=True, blank=True, help_text=_("Positioning rank of a collection")
     )
     exclusion_reason = models.CharField(
@@ -150,15 +182,22 @@ class Collection(models.Model):
     )
     comments = GenericRelation(Comment)
 
-    _extended_permissions = [
+    objects = CollectionQuerySet.as_manager()
+
+    _extended_permissions = (
         "position",
         "finish_instruction_turn",
-    ]
+    )
 
     class Meta:
         verbose_name = _("Collection")
         verbose_name_plural = _("Collections")
-        ordering = ["resource__title"]
+        indexes = [
+            # Serves the lookups by resource, by resource and library, and reads the position from the index
+            models.Index(fields=["resource", "library"], name="collection_resource_lib_idx", include=["position"]),
+            models.Index(fields=["library", "resource"], name="collection_lib_resource_idx"),
+            models.Index(fields=["project", "library"], name="collection_proj_lib_idx", include=["position"]),
+        ]
 
     def __str__(self):
         return f"{self.id}"
@@ -166,9 +205,14 @@ class Collection(models.Model):
     def save(self, *args, **kwargs):
         if self.position is not None and self.position != 0:
             self.exclusion_reason = ""
-        self.full_clean()
         return super().save(*args, **kwargs)
 
+    @property
+    def latest_positioning_comment(self) -> Comment | None:
+        if hasattr(self, "positioning_comments"):
+            return next(iter(self.positioning_comments), None)
+        return self.comments.filter(subject=_("Positioning comment")).order_by("-created_at").first()
+
     @property
     def is_excluded(self) -> bool:
         return self.position == 0
@@ -26,6 +26,9 @@ class Comment(models.Model):
     class Meta:
         verbose_name = _("Comment")
         verbose_name_plural = _("Comments")
+        indexes = [
+            models.Index(fields=["content_type", "object_id"]),
+        ]
 
     def __str__(self):
         return f"{textwrap.shorten(self.subject, width=20, placeholder='…')} by {self.author} on {self.content_object}"
@@ -37,6 +37,9 @@ class ActionLog(models.Model):
         verbose_name = _("Log Entry")
         verbose_name_plural = _("Log Entries")
         ordering = ["-action_time"]
+        indexes = [
+            models.Index(fields=["content_type", "object_id"]),
+        ]
 
     def __str__(self):
         return f"{self.action_time:%Y-%m-%d %H:%M:%S} - {self.action_message} by {self.actor} ({self.ip}) on {self.content_object}"
@@ -46,7 +49,7 @@ class ActionLog(models.Model):
         cls, message: str, actor: User, ip: str = "", obj: models.Model = None, request: HttpRequest | Request = None
     ):
         if not ip.strip() and request:
-            ip = get_client_ip(request)[0] or ""
+            ip = cls.get_request_ip(request)
         if len(message) > 255:
             message = message[:252] + "..."
         ActionLog.objects.create(
@@ -56,4 +59,16 @@ class ActionLog(models.Model):
             content_object=obj,
             created_by=actor,
         )
-        logger.info(f"{message} by {actor.username} ({ip}) on {str(obj)}")
+        # Let logging format the message: str(obj) may query the database and is skipped when INFO is disabled
+        logger.info("%s by %s (%s) on %s", message, actor.username, ip, obj)
+
+    @staticmethod
+    def get_request_ip(request: HttpRequest | Request) -> str:
+        """
+        Returns the client ip of the request.
+        It is remembered on the underlying HttpRequest, shared with the DRF request.
+        """
+        http_request = getattr(request, "_request", request)
+        if "_action_log_ip" not in http_request.__dict__:
+            http_request.__dict__["_action_log_ip"] = get_client_ip(http_request)[0] or ""
+        return http_request.__dict__["_action_log_ip"]
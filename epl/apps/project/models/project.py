@@ -28,7 +28,9 @@ class ProjectQuerySet(models.QuerySet):
         if user.is_superuser or user.is_project_creator:
             return self.all()
 
-        return (self.public() | self.participating(user)).distinct()
+        # Each branch keeps its own inner join, instead of an OR over a left outer join on user_roles
+        project_ids = self.public().order_by().values("id").union(self.participating(user).order_by().values("id"))
+        return self.filter(id__in=project_ids)
 
     def participating(self, user: User = None) -> models.QuerySet[Project]:
         if not user or not user.is_authenticated:
@@ -37,10 +39,10 @@ class ProjectQuerySet(models.QuerySet):
         # Si le project n'est pas lancé, seuls les admin, manager peuvent le voir
         # Pour les autres roles, il faut que le projet soit lancé.
         return self.filter(
-            models.Q(user_roles__user=user, user_roles__role__in=[Role.PROJECT_ADMIN, Role.PROJECT_MANAGER])
+            models.Q(user_roles__user=user, user_roles__role__in=_MANAGING_ROLES)
             | models.Q(
                 user_roles__user=user,
-                user_roles__role__in=[Role.INSTRUCTOR, Role.CONTROLLER, Role.GUEST],
+                user_roles__role__in=_PARTICIPANT_ROLES,
                 status__gte=ProjectStatus.LAUNCHED,
                 active_after__lte=now(),
             )
@@ -55,6 +57,12 @@ class ProjectQuerySet(models.QuerySet):
     def public(self) -> models.QuerySet[Project]:
         return self.filter(is_private=False, status__gte=ProjectStatus.LAUNCHED, active_after__lte=now())
 
+    def lite(self) -> models.QuerySet[Project]:
+        """
+        Defer the invitations, which are only read by the invitation endpoints.
+        """
+        return self.defer("invitations")
+
     def exclude_archived(self, exclude: bool = True) -> models.QuerySet[Project]:
         if exclude:
             return self.filter(status__lt=ProjectStatus.ARCHIVED)
@@ -84,7 +92,7 @@ class Project(models.Model):
     created_at = models.DateTimeField(_("Created at"), auto_now_add=True)
     updated_at = models.DateTimeField(_("Updated at"), auto_now=True)
 
-    _extended_permissions = [
+    _extended_permissions = (
         "add_library",
         "remove_library",
         "assign_roles",
@@ -94,7 +102,7 @@ class Project(models.Model):
         "remove_exclusion_reason",
         "status",
         "launch",
-    ]
+    )
 
     objects = ProjectQuerySet.as_manager()
 
@@ -108,6 +116,19 @@ class Project(models.Model):
                 name="%(app_label)s_%(class)s_status_valid",
             ),
         ]
+        indexes = [
+            # Partial indexes matching ProjectQuerySet.public() and ProjectQuerySet.active()
+            models.Index(
+                fields=["active_after"],
+                condition=models.Q(is_private=False, status__gte=ProjectStatus.LAUNCHED),
+                name="project_public_idx",
+            ),
+            models.Index(
+                fields=["active_after"],
+                condition=models.Q(status__gte=ProjectStatus.LAUNCHED, status__lt=ProjectStatus.ARCHIVED),
+                name="project_active_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.name
@@ -116,10 +137,6 @@ class Project(models.Model):
     def default_language(self) -> str | None:
         return self.settings.get("default_language")
 
-    def delete(self, *args, **kwargs):
-        self.libraries.clear()
-        super().delete(*args, **kwargs)
-
     @property
     def exclusion_reasons(self):
         return self.settings.get("exclusion_reasons", [])
@@ -129,11 +146,21 @@ class Project(models.Model):
         return (ProjectStatus.LAUNCHED <= self.status < ProjectStatus.ARCHIVED) and self.active_after <= now()
 
 
+class ProjectLibraryQuerySet(models.QuerySet):
+    def with_names(self) -> models.QuerySet[ProjectLibrary]:
+        """
+        Join the project and the library, read by __str__ and the library details.
+        """
+        return self.select_related("project", "library")
+
+
 class ProjectLibrary(models.Model):
     project = models.ForeignKey("Project", on_delete=models.CASCADE)
     library = models.ForeignKey("Library", on_delete=models.CASCADE)
     is_alternative_storage_site = models.BooleanField(_("Is alternative storage site"), default=False)
 
+    objects = ProjectLibraryQuerySet.as_manager()
+
     class Meta:
         constraints = [models.UniqueConstraint(fields=["project", "library"], name="unique_project_library")]
 
@@ -156,6 +183,11 @@ class Role(models.TextChoices):
     GUEST = "guest", _("Guest")
 
 
+# Roles that see a project before it is launched, and roles that only see it once launched
+_MANAGING_ROLES = (Role.PROJECT_ADMIN.value, Role.PROJECT_MANAGER.value)
+_PARTICIPANT_ROLES = (Role.INSTRUCTOR.value, Role.CONTROLLER.value, Role.GUEST.value)
+
+
 class UserRole(models.Model):
     id = UUIDPrimaryKeyField()
     user = models.ForeignKey("user.User", on_delete=models.CASCADE, related_name="project_roles")
@@ -190,6 +222,25 @@ class UserRole(models.Model):
                 name="%(app_label)s_%(class)s_role_valid",
             ),
         ]
+        indexes = [
+            # User.role_set reads every role of a user: covered so it is answered from the index alone
+            models.Index(fields=["user"], include=["project", "library", "role"], name="userrole_user_covering_idx"),
+            models.Index(fields=["project", "role"], name="userrole_project_role_idx"),
+        ]
 
     def __str__(self):
         return f"{self.user} - {self.get_role_display()} ({self.project})"
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._clear_user_role_cache()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        self._clear_user_role_cache()
+        return result
+
+    def _clear_user_role_cache(self) -> None:
+        # Only the user instance attached to this role is refreshed, without fetching it
+        if (user := self._state.fields_cache.get("user")) is not None:
+            user.clear_role_cache()
@@ -31,7 +31,7 @@ class Segment(models.Model):
     created_by = models.ForeignKey("user.User", on_delete=models.SET_NULL, null=True, blank=True)
     created_at = models.DateTimeField(_("Created at"), auto_now_add=True)
 
-    _extended_permissions = ["up", "down"]
+    _extended_permissions = ("up", "down")
 
     class Meta:
         verbose_name = _("Collection segment")
@@ -43,16 +43,25 @@ class Segment(models.Model):
                 deferrable=models.Deferrable.DEFERRED,
             ),
         ]
+        indexes = [
+            models.Index(
+                fields=["collection", "order"],
+                condition=models.Q(content=CONTENT_NIHIL),
+                name="segment_nihil_order_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.collection.project} - {_('Segment')} n°{self.order}: {self.content}"
 
     @classmethod
     def get_last_order(cls, resource: Resource) -> int:
-        max_order = resource.segments.aggregate(models.Max("order"))["order__max"] or 0
+        max_order = resource.segments.order_by("-order").values_list("order", flat=True).first() or 0
         return max_order + 1
 
     @classmethod
     def get_highest_nihil_segment_order(cls, resource: Resource) -> int:
-        max_nihil_order = resource.segments.filter(content=CONTENT_NIHIL).aggregate(models.Max("order"))["order__max"]
+        max_nihil_order = (
+            resource.segments.filter(content=CONTENT_NIHIL).order_by("-order").values_list("order", flat=True).first()
+        )
         return max_nihil_order or 0
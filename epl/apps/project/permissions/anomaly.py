@@ -1,7 +1,6 @@
-from django.db.models import Q, Subquery
 from rest_framework.permissions import BasePermission
 
-from epl.apps.project.models import Anomaly, Library, Role, Segment, UserRole
+from epl.apps.project.models import Anomaly, Role, Segment
 from epl.apps.user.models import User
 
 
@@ -31,24 +30,17 @@ class AnomalyPermissions(BasePermission):
                     return False
                 # user must be an admin in the project
                 # or instructor in the collection's library
-                return UserRole.objects.filter(
-                    Q(
-                        user=user,
-                        role=Role.PROJECT_ADMIN,
-                        project=anomaly.segment.collection.project,
-                    )
-                    | Q(
-                        user=user,
-                        role=Role.INSTRUCTOR,
-                        project=anomaly.segment.collection.project,
-                        library=anomaly.segment.collection.library,
-                    )
-                ).exists()
+                collection = anomaly.segment.collection
+                return user.is_project_admin(collection.project_id) or user.is_instructor(
+                    collection.project_id, collection.library_id
+                )
             case "destroy":
                 return bool(
                     user
                     and user.is_authenticated
-                    and (anomaly.created_by.id == user.id or user.is_project_admin(anomaly.resource.project))
+                    and (
+                        anomaly.created_by_id == user.id or user.is_project_admin(anomaly.segment.collection.project_id)
+                    )
                 )
         return False
 
@@ -61,16 +53,10 @@ class AnomalyPermissions(BasePermission):
             return True
         # user must be a controller in the project
         # or instructor in the project for another library as the segment's collection library
-        return UserRole.objects.filter(
-            Q(
-                user=user,
-                role=Role.INSTRUCTOR,
-                project=segment.collection.project,
-                library__in=Subquery(
-                    Library.objects.filter(
-                        Q(project=segment.collection.project) & ~Q(id=segment.collection.library_id)
-                    ).values("id")
-                ),
-            )
-            | Q(user=user, role=Role.CONTROLLER, project=segment.collection.project)
-        ).exists()
+        # Roles on a library are deleted when it leaves the project,
+        # so every instructor role in the project is bound to one of its libraries.
+        project_id, library_id = segment.collection.project_id, segment.collection.library_id
+        return user.is_controller(project_id) or any(
+            role == Role.INSTRUCTOR and role_project_id == project_id and role_library_id not in (None, library_id)
+            for role_project_id, role_library_id, role in user.role_set
+        )
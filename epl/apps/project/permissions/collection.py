@@ -24,7 +24,6 @@ class CollectionPermission(permissions.BasePermission):
                 | "position"
                 | "exclude"
                 | "comment_positioning"
-                | "position"
                 | "finish_instruction_turn"
             ):
                 return bool(request.user and self.user_has_permission(view.action, request.user, obj))
@@ -36,20 +35,26 @@ class CollectionPermission(permissions.BasePermission):
         match action:
             case "position":
                 return bool(
-                    user and user.is_authenticated and user.is_instructor(project=obj.project, library=obj.library)
+                    user
+                    and user.is_authenticated
+                    and user.is_instructor(project=obj.project_id, library=obj.library_id)
                 )
             case "finish_instruction_turn":
                 return bool(
-                    user and user.is_authenticated and user.is_instructor(project=obj.project, library=obj.library)
+                    user
+                    and user.is_authenticated
+                    and user.is_instructor(project=obj.project_id, library=obj.library_id)
                 )
             case "comment_positioning":
                 return bool(
-                    user and user.is_authenticated and user.is_instructor(project=obj.project, library=obj.library)
+                    user
+                    and user.is_authenticated
+                    and user.is_instructor(project=obj.project_id, library=obj.library_id)
                 )
             case "import_csv" | "bulk_delete":
                 return bool(user and user.is_authenticated and user.is_project_creator)
-            case "update" | "partial_update" | "position" | "exclude":
-                return bool(user and user.is_authenticated and user.is_instructor(obj.project, obj.library))
+            case "update" | "partial_update" | "exclude":
+                return bool(user and user.is_authenticated and user.is_instructor(obj.project_id, obj.library_id))
             case "destroy":
                 return bool(user and user.is_authenticated and user.is_project_creator)
             case "create":
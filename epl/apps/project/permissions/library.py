@@ -5,25 +5,25 @@ from epl.apps.user.models import User
 
 
 class LibraryPermission(BasePermission):
+    object_actions = frozenset(
+        [
+            "retrieve",
+            "update",
+            "partial_update",
+            "destroy",
+        ]
+    )
+
     def has_permission(self, request, view):
         match view.action:
             case "list" | "retrieve":
                 return True
             case "create":
-                return request.user.is_authenticated and (
-                    request.user.is_superuser
-                    or request.user.is_project_creator
-                    or request.user.is_project_admin(project=None, search_for_any=True)
-                )
+                return request.user.is_authenticated and request.user.can_manage_libraries
         return request.user and request.user.is_authenticated
 
     def has_object_permission(self, request, view, obj):
-        if view.action in [
-            "retrieve",
-            "update",
-            "partial_update",
-            "destroy",
-        ]:
+        if view.action in self.object_actions:
             return self.user_has_permission(view.action, request.user, obj)
         return False
 
@@ -33,9 +33,5 @@ class LibraryPermission(BasePermission):
             case "retrieve":
                 return True
             case "update" | "partial_update" | "destroy":
-                return (
-                    user.is_superuser
-                    or user.is_project_creator
-                    or user.is_project_admin(project=None, search_for_any=True)
-                )
+                return user.can_manage_libraries
         return False
@@ -3,24 +3,19 @@ from rest_framework.permissions import BasePermission
 from epl.apps.project.models import Project, ProjectStatus, Role
 from epl.apps.user.models import User
 
+# Roles that see a project once it is launched
+_LAUNCHED_PROJECT_ROLES = frozenset([Role.CONTROLLER.value, Role.INSTRUCTOR.value, Role.GUEST.value])
 
-class ProjectPermissions(BasePermission):
-    def has_permission(self, request, view):
-        match view.action:
-            case "create":
-                return bool(request.user.is_authenticated and request.user.is_project_creator)
-            case _:
-                return True
 
-    def has_object_permission(self, request, view, obj: Project) -> bool:
-        if view.action in [
+class ProjectPermissions(BasePermission):
+    object_actions = frozenset(
+        [
             "retrieve",
             "update",
             "partial_update",
             "destroy",
             "add_library",
             "remove_library",
-            "remove_library",
             "assign_roles",
             "remove_roles",
             "update_status",
@@ -30,7 +25,18 @@ class ProjectPermissions(BasePermission):
             "add_invitation",
             "remove_invitation",
             "launch",
-        ]:
+        ]
+    )
+
+    def has_permission(self, request, view):
+        match view.action:
+            case "create":
+                return bool(request.user.is_authenticated and request.user.is_project_creator)
+            case _:
+                return True
+
+    def has_object_permission(self, request, view, obj: Project) -> bool:
+        if view.action in self.object_actions:
             return self.user_has_permission(view.action, request.user, obj)
         if view.action == "validate":
             return self.user_has_permission("validate", request.user, obj)
@@ -43,21 +49,15 @@ class ProjectPermissions(BasePermission):
         elif not user.is_authenticated:
             return False
 
-        permission_checks = [
-            (ProjectStatus.DRAFT, lambda: user.is_project_creator),
-            (ProjectStatus.REVIEW, lambda: user.is_project_admin(project=project)),
-            (ProjectStatus.READY, lambda: user.is_project_manager(project=project)),
-            (
-                ProjectStatus.LAUNCHED,
-                lambda: user.is_controller(project=project)
-                or user.is_instructor(project=project)
-                or user.is_guest(project=project),
-            ),
-        ]
-
-        for status, check in permission_checks:
-            if project.status >= status and check():
-                return True
+        roles = user.roles_in(project)
+        if project.status >= ProjectStatus.DRAFT and user.is_project_creator:
+            return True
+        if project.status >= ProjectStatus.REVIEW and Role.PROJECT_ADMIN in roles:
+            return True
+        if project.status >= ProjectStatus.READY and Role.PROJECT_MANAGER in roles:
+            return True
+        if project.status >= ProjectStatus.LAUNCHED and not roles.isdisjoint(_LAUNCHED_PROJECT_ROLES):
+            return True
 
         return not project.is_private
 
@@ -67,7 +67,7 @@ class ProjectPermissions(BasePermission):
 
     @staticmethod
     def compute_validate_permission(user: User, project: Project = None) -> bool:
-        return user.project_roles.filter(project=project, role=Role.PROJECT_MANAGER).exists()
+        return user.is_project_manager(project=project)
 
     @staticmethod
     def compute_update_status_permission(user: User, project: Project = None) -> bool:
@@ -5,15 +5,8 @@ from epl.apps.user.models import User
 
 
 class ResourcePermission(BasePermission):
-    def has_permission(self, request, view):
-        return True
-
-    def has_object_permission(self, request, view, obj: Resource):
-        if request.method in ("GET", "HEAD", "OPTIONS"):
-            # Allow read-only methods to anybody
-            return True
-
-        if view.action in [
+    object_actions = frozenset(
+        [
             "retrieve",
             "update",
             "partial_update",
@@ -23,7 +16,18 @@ class ResourcePermission(BasePermission):
             "report_anomalies",
             "reset_instruction",
             "reassign_instruction_turn",
-        ]:
+        ]
+    )
+
+    def has_permission(self, request, view):
+        return True
+
+    def has_object_permission(self, request, view, obj: Resource):
+        if request.method in ("GET", "HEAD", "OPTIONS"):
+            # Allow read-only methods to anybody
+            return True
+
+        if view.action in self.object_actions:
             return self.user_has_permission(view.action, request.user, obj)
 
         return False
@@ -44,15 +48,15 @@ class ResourcePermission(BasePermission):
             case "collections":
                 return True
             case "validate_control":
-                return bool(user and user.is_authenticated and user.is_controller(resource.project))
+                return bool(user and user.is_authenticated and user.is_controller(resource.project_id))
             case "report_anomalies":
                 # user is controller or instructor for the project
                 return bool(
                     user
                     and user.is_authenticated
-                    and (user.is_controller(resource.project) or user.is_instructor(resource.project))
+                    and (user.is_controller(resource.project_id) or user.is_instructor(resource.project_id))
                 )
             case "reset_instruction" | "reassign_instruction_turn":
-                return bool(user and user.is_authenticated and user.is_project_admin(resource.project))
+                return bool(user and user.is_authenticated and user.is_project_admin(resource.project_id))
 
         return False
@@ -5,11 +5,22 @@ from epl.apps.user.models import User
 
 
 class SegmentPermissions(BasePermission):
+    object_actions = frozenset(
+        [
+            "partial_update",
+            "destroy",
+            "up",
+            "down",
+        ]
+    )
+
     def has_permission(self, request, view):
         match view.action:
             case "create":
                 try:
-                    collection = Collection.objects.get(pk=request.data.get("collection"))
+                    collection = Collection.objects.only("project_id", "library_id").get(
+                        pk=request.data.get("collection")
+                    )
                     return request.user.is_authenticated and (
                         self.is_user_instructor(collection=collection, user=request.user)
                         or self.is_user_admin(collection=collection, user=request.user)
@@ -20,12 +31,7 @@ class SegmentPermissions(BasePermission):
                 return True
 
     def has_object_permission(self, request, view, obj: Segment) -> bool:
-        if view.action in [
-            "partial_update",
-            "destroy",
-            "up",
-            "down",
-        ]:
+        if view.action in self.object_actions:
             return self.user_has_permission(view.action, request.user, obj)
         return False
 
@@ -47,8 +53,8 @@ class SegmentPermissions(BasePermission):
 
     @staticmethod
     def is_user_instructor(collection: Collection, user: User) -> bool:
-        return user.is_instructor(project=collection.project, library=collection.library)
+        return user.is_instructor(project=collection.project_id, library=collection.library_id)
 
     @staticmethod
     def is_user_admin(collection: Collection, user: User) -> bool:
-        return user.is_project_admin(project=collection.project)
+        return user.is_project_admin(project=collection.project_id)
@@ -2,7 +2,7 @@ from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
 
-from epl.apps.project.models import Anomaly, AnomalyType
+from epl.apps.project.models import Anomaly, AnomalyType, Segment
 from epl.apps.project.serializers.segment import NestedSegmentSerializer
 from epl.apps.user.serializers import NestedUserSerializer
 from epl.services.permissions.serializers import AclField, AclSerializerMixin
@@ -52,22 +52,22 @@ class AnomalySerializer(AclSerializerMixin, serializers.ModelSerializer):
         return attrs
 
     def validate_segment_id(self, value):
-        from epl.apps.project.models import Segment
+        if (segment := self.context.get("segment")) is not None and segment.pk == value:
+            return segment
 
         try:
-            segment = Segment.objects.get(id=value)
+            segment = Segment.objects.select_related("collection").get(id=value)
         except Segment.DoesNotExist:
             raise serializers.ValidationError(_("Segment with the given ID does not exist."))
         return segment
 
     def create(self, validated_data):
         segment = validated_data.pop("segment_id")
-        resource = segment.collection.resource
         user = self.context["request"].user
 
         anomaly = Anomaly.objects.create(
             segment=segment,
-            resource=resource,
+            resource_id=segment.collection.resource_id,
             created_by=user,
             **validated_data,
         )
@@ -78,5 +78,6 @@ class AnomalySerializer(AclSerializerMixin, serializers.ModelSerializer):
         self.instance.fixed = True
         self.instance.fixed_by = user
         self.instance.fixed_at = timezone.now()
-        self.instance.save(update_fields=["fixed", "fixed_by", "fixed_at"])
+        # Anomaly.save() would run full_clean() and check every foreign key again
+        Anomaly.objects.filter(pk=self.instance.pk).update(fixed=True, fixed_by=user, fixed_at=self.instance.fixed_at)
         return self.instance
@@ -1,7 +1,8 @@
+import codecs
 import csv
-import io
 import logging
 from collections import Counter
+from functools import cached_property
 
 from django.db import models, transaction
 from django.db.models import QuerySet
@@ -77,8 +78,9 @@ class ImportSerializer(serializers.Serializer):
 
     def get_file_reader(self, csv_file):
         if not self.csv_reader:
+            # Decode the upload line by line rather than reading it whole in memory
             self.csv_reader = csv.DictReader(
-                io.StringIO(csv_file.read().decode("utf-8-sig")),
+                codecs.iterdecode(csv_file, "utf-8-sig"),
                 delimiter=";",
             )
 
@@ -95,9 +97,6 @@ class ImportSerializer(serializers.Serializer):
         resource_ids_to_replace = {}  # To track resources that were already in the database
 
         collections, resources, codes, errors = handle_import(csv_reader, library.id, project.id, user.id)
-        existing_resources = {
-            _res.code: _res.id for _res in Resource.objects.filter(project_id=project.id).only("id", "code")
-        }
         resources_to_create = []
         collections_to_create = []
 
@@ -105,6 +104,9 @@ class ImportSerializer(serializers.Serializer):
             raise serializers.ValidationError({"csv_file": [{"row": row, "errors": errs} for row, errs in errors]})
         else:
             # Resource may already be imported for a project, we need to check
+            existing_resources = dict(
+                Resource.objects.filter(project_id=project.id, code__in=codes).values_list("code", "id")
+            )
             for resource in resources:
                 if resource.code in existing_resources:
                     # Resource already exists, reuse its ID
@@ -124,9 +126,7 @@ class ImportSerializer(serializers.Serializer):
                     )
 
             BATCH_SIZE = 500
-            for i in range(0, len(resources_to_create), BATCH_SIZE):
-                batch = resources_to_create[i : i + BATCH_SIZE]
-                Resource.objects.bulk_create(batch)
+            Resource.objects.bulk_create(resources_to_create, batch_size=BATCH_SIZE)
 
             for collection in collections:
                 collections_to_create.append(
@@ -142,11 +142,8 @@ class ImportSerializer(serializers.Serializer):
                     )
                 )
 
-            for i in range(0, len(collections_to_create), BATCH_SIZE):
-                batch = collections_to_create[i : i + BATCH_SIZE]
-                Collection.objects.bulk_create(batch)
+            Collection.objects.bulk_create(collections_to_create, batch_size=BATCH_SIZE)
 
-        loaded_collections = {_code: _data["count"] for _code, _data in codes.items()}
         ActionLog.log(
             f"Imported {len(collections_to_create)} collections in {library.name}",
             actor=user,
@@ -154,7 +151,8 @@ class ImportSerializer(serializers.Serializer):
             request=self.context.get("request"),
         )
 
-        return Counter(loaded_collections.values())
+        # Number of resources by number of collections imported for them
+        return Counter(_data["count"] for _data in codes.values())
 
     def validate_csv_file(self, value):
         csv_reader = self.get_file_reader(value)
@@ -273,10 +271,11 @@ class BaseCollectionPositioningSerializer(
         - ZERO: If no library has chosen rank 1, all have positioned (position >= 0), and at least one collection is not excluded (position 0)
         - NONE: In other cases
         """
-        num_rank_one = collections.filter(position=1).count()
+        positions = [c.position for c in collections]
+        num_rank_one = positions.count(1)
         # having positioned means a position is not null (either > 0 or 0 for exclusion)
-        all_have_positioned = not collections.filter(position__isnull=True).exists()
-        at_least_one_didnt_exclude = collections.filter(position__gt=0).exists()
+        all_have_positioned = None not in positions
+        at_least_one_didnt_exclude = any(position is not None and position > 0 for position in positions)
 
         arbitration = Arbitration.NONE
         status = resource.status
@@ -327,7 +326,8 @@ class PositionSerializer(BaseCollectionPositioningSerializer):
         collection.save(update_fields=["position", "exclusion_reason"])
 
         resource = collection.resource
-        collections = resource.collections.all()
+        # Only the positions are needed, load them once for all the checks below
+        collections = resource.collections.only("id", "resource_id", "library_id", "position")
 
         self.calculate_arbitration(collections, resource, collection, position)
         self.handle_arbitration_notification(resource, resource.arbitration)
@@ -366,7 +366,8 @@ class ExclusionSerializer(BaseCollectionPositioningSerializer):
         instance.save()
 
         resource = instance.resource
-        collections = resource.collections.all()
+        # Only the positions are needed, load them once for all the checks below
+        collections = resource.collections.only("id", "resource_id", "library_id", "position")
 
         self.calculate_arbitration(collections, resource)
         self.handle_arbitration_notification(resource, resource.arbitration)
@@ -414,11 +415,16 @@ class CollectionPositioningSerializer(AclSerializerMixin, serializers.ModelSeria
             "acl",
         ]
 
+    @cached_property
+    def comment_serializer(self) -> PositioningCommentSerializer:
+        # Built once and reused for every collection of the response
+        return PositioningCommentSerializer()
+
     @extend_schema_field(PositioningCommentSerializer(many=True))
     def get_comment_positioning(self, obj):
-        comment = obj.comments.filter(subject=_("Positioning comment")).order_by("-created_at").first()
+        comment = obj.latest_positioning_comment
         if comment:
-            return PositioningCommentSerializer(comment).data
+            return self.comment_serializer.to_representation(comment)
         return None
 
     @extend_schema_field(NestedAnomalySerializer)
@@ -1,3 +1,5 @@
+from uuid import UUID
+
 from epl.apps.project.models import Collection, Resource
 from epl.apps.project.models.collection import TurnType
 from epl.apps.user.models import User
@@ -15,19 +17,29 @@ class ResourceInstructionMixin:
 
         if not user or not user.is_authenticated or not library_id:
             return False
-        return user.is_instructor(resource.project, library_id)
+        return user.is_instructor(resource.project_id, library_id)
 
     def get_should_position(self, obj) -> bool:
         # obj can be either a Resource or a Collection
         resource = obj if isinstance(obj, Resource) else obj.resource
         user: User = self.context.get("request").user
-        library_id_selected = self.context.get("library") if isinstance(obj, Resource) else obj.library.id
+        library_id_selected = self.context.get("library") if isinstance(obj, Resource) else obj.library_id
 
         if (
             library_id_selected
             and user.is_authenticated
-            and user.is_instructor(project=resource.project, library=library_id_selected)
+            and user.is_instructor(project=resource.project_id, library=library_id_selected)
         ):
+            if "collections" in getattr(resource, "_prefetched_objects_cache", {}):
+                # The resource list prefetches the collections, don't query them again for each resource.
+                # The selected library comes from the query string, in any form UUID() accepts
+                library_id = UUID(str(library_id_selected))
+                return any(
+                    _collection.library_id == library_id
+                    and _collection.position is None
+                    and not _collection.exclusion_reason
+                    for _collection in resource.collections.all()
+                )
             return Collection.objects.filter(
                 resource=resource, library_id=library_id_selected, position=None, exclusion_reason__in=["", None]
             ).exists()
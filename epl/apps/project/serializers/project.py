@@ -110,6 +110,8 @@ class ProjectUserSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
     def get_roles(self, instance) -> list[str]:
+        if (roles := getattr(instance, "roles", None)) is not None:
+            return roles
         return [role.role for role in instance.project_roles.all()]
 
 
@@ -137,15 +139,13 @@ class InvitationSerializer(serializers.Serializer):
         if role is not None and role != Role.INSTRUCTOR:
             raise serializers.ValidationError(_("Library should not be provided for this role."))
         project = self.context["project"]
-        if not project.libraries.filter(pk=library_id).exists():
+        if not project.projectlibrary_set.filter(library_id=library_id).exists():
             raise serializers.ValidationError(_("Library is not attached to the project."))
         return str(library_id)
 
     def validate(self, attrs):
         project = self.context["project"]
-        try:
-            Project.objects.get(pk=project.pk)
-        except Project.DoesNotExist:
+        if not Project.objects.filter(pk=project.pk).exists():
             raise serializers.ValidationError(_("Project does not exist."))
 
         role = self.initial_data.get("role")
@@ -450,7 +450,7 @@ class ProjectLibrarySerializer(serializers.Serializer):
 
         if self.context["request"].method == "DELETE":
             project = self.context["project"]
-            if not project.libraries.filter(id=value).exists():
+            if not project.projectlibrary_set.filter(library_id=value).exists():
                 raise serializers.ValidationError(_("Library is not attached to the project."))
         return value
 
@@ -458,7 +458,7 @@ class ProjectLibrarySerializer(serializers.Serializer):
         project = self.context["project"]
         library = Library.objects.get(id=self.validated_data.get("library_id"))
         if self.context["request"].method == "POST":
-            if not project.libraries.filter(id=library.id).exists():
+            if not project.projectlibrary_set.filter(library_id=library.id).exists():
                 project.libraries.add(library)
                 ActionLog.log(
                     f"Library <{library.name}> attached to project <{project.name}>",
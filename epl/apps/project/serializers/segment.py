@@ -6,7 +6,7 @@ from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 from rest_framework.exceptions import NotFound, ValidationError
 
-from epl.apps.project.models import ResourceStatus, Segment
+from epl.apps.project.models import Collection, ResourceStatus, Segment
 from epl.apps.project.models.choices import SegmentType
 from epl.apps.project.models.segment import CONTENT_NIHIL
 from epl.apps.project.serializers.nested import NestedAnomalySerializer
@@ -26,6 +26,8 @@ class NestedSegmentSerializer(serializers.ModelSerializer):
 
 class SegmentSerializer(AclSerializerMixin, serializers.ModelSerializer):
     acl = AclField(exclude=["retrieve", "update"])
+    # The resource of the collection sets the order and type of a new segment
+    collection = serializers.PrimaryKeyRelatedField(queryset=Collection.objects.select_related("resource"))
     after_segment = serializers.UUIDField(required=False, write_only=True)
     anomalies = serializers.SerializerMethodField()
 
@@ -0,0 +1,61 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.utils import timezone
+from django_tenants.test.cases import TenantTestCase
+
+from epl.apps.project.management.commands.purge_logs import Command
+from epl.apps.project.models import ActionLog
+from epl.apps.project.tests.factories.library import LibraryFactory
+from epl.apps.project.tests.factories.user import UserFactory
+
+
+class PurgeLogsTest(TenantTestCase):
+    def setUp(self):
+        self.user = UserFactory()
+        self.library = LibraryFactory()
+        for i in range(5):
+            ActionLog.log(f"Old log {i}", self.user, obj=self.library)
+        # action_time is set on save, backdate the entries afterwards
+        ActionLog.objects.update(action_time=timezone.now() - timedelta(days=60))
+        ActionLog.log("Recent log", self.user, obj=self.library)
+
+    def purge(self, *args):
+        call_command("purge_logs", "--schema", self.tenant.schema_name, *args, stdout=StringIO())
+
+    def test_purge_old_logs(self):
+        self.purge("--older-than", "30D")
+        self.assertListEqual(list(ActionLog.objects.values_list("action_message", flat=True)), ["Recent log"])
+
+    def test_dry_run_keeps_logs(self):
+        self.purge("--older-than", "30D", "--dry-run")
+        self.assertEqual(ActionLog.objects.count(), 6)
+
+    def test_delete_in_batches(self):
+        deleted_count = Command.delete_in_batches(ActionLog.objects.filter(action_message__startswith="Old"), 2)
+        self.assertEqual(deleted_count, 5)
+        self.assertEqual(ActionLog.objects.count(), 1)
+
+    def test_parse_duration(self):
+        self.assertEqual(Command.parse_duration("30D"), timedelta(days=30))
+        self.assertEqual(Command.parse_duration("4W"), timedelta(weeks=4))
+        self.assertEqual(Command.parse_duration("12M"), timedelta(days=360))
+        self.assertEqual(Command.parse_duration("1Y"), timedelta(days=365))
+        for invalid in ("", "D", "30", "30d", "-3D", "3.5D", " 3D", "²D", "30DD"):
+            with self.subTest(value=invalid):
+                self.assertIsNone(Command.parse_duration(invalid))
+
+    def test_invalid_duration(self):
+        with self.assertRaises(CommandError):
+            self.purge("--older-than", "30X")
+        self.assertEqual(ActionLog.objects.count(), 6)
+
+    def test_dry_run_reports_counts_by_type(self):
+        stdout = StringIO()
+        call_command(
+            "purge_logs", "--schema", self.tenant.schema_name, "--older-than", "30D", "--dry-run", stdout=stdout
+        )
+        output = stdout.getvalue()
+        self.assertIn("5 log entries on project.library", output)
+        self.assertIn("Purged 5 log entries", output)
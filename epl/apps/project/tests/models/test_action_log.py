@@ -0,0 +1,29 @@
+from unittest import mock
+
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from epl.apps.project.models import ActionLog
+from epl.apps.project.tests.factories.library import LibraryFactory
+from epl.apps.project.tests.factories.user import UserFactory
+from epl.tests import TestCase
+
+
+class ActionLogTest(TestCase):
+    def test_log(self):
+        user = UserFactory()
+        library = LibraryFactory()
+        with self.assertLogs("epl.apps.project.models.logging", level="INFO") as logs:
+            ActionLog.log("Library updated", user, ip="127.0.0.1", obj=library)
+
+        entry = ActionLog.objects.get()
+        self.assertEqual(entry.content_object, library)
+        self.assertEqual(entry.ip, "127.0.0.1")
+        self.assertEqual(logs.records[0].getMessage(), f"Library updated by {user.username} (127.0.0.1) on {library}")
+
+    def test_request_ip_is_remembered(self):
+        request = Request(APIRequestFactory().get("/", REMOTE_ADDR="10.0.0.1"))
+        self.assertEqual(ActionLog.get_request_ip(request), "10.0.0.1")
+        with mock.patch("epl.apps.project.models.logging.get_client_ip") as get_client_ip:
+            self.assertEqual(ActionLog.get_request_ip(request._request), "10.0.0.1")
+        get_client_ip.assert_not_called()
@@ -0,0 +1,37 @@
+from epl.apps.project.models import Collection
+from epl.apps.project.tests.factories.collection import CollectionFactory
+from epl.tests import TestCase
+
+
+class CollectionSaveTest(TestCase):
+    def test_save_is_a_single_query(self):
+        collection = CollectionFactory()
+        collection.position = 2
+        with self.assertNumQueries(1):
+            collection.save()
+
+    def test_positioning_resets_exclusion_reason(self):
+        collection = CollectionFactory(position=0, exclusion_reason="Doublon")
+        collection.position = 1
+        collection.save()
+        collection.refresh_from_db()
+        self.assertEqual(collection.exclusion_reason, "")
+
+
+class CollectionPositioningCommentTest(TestCase):
+    def setUp(self):
+        self.collection = CollectionFactory()
+        self.collection.comments.create(subject="Positioning comment", content="first")
+        self.collection.comments.create(subject="Positioning comment", content="latest")
+        self.collection.comments.create(subject="Other comment", content="other")
+
+    def test_latest_positioning_comment(self):
+        self.assertEqual(self.collection.latest_positioning_comment.content, "latest")
+
+    def test_latest_positioning_comment_is_prefetched(self):
+        collection = Collection.objects.with_positioning_comments().get(id=self.collection.id)
+        with self.assertNumQueries(0):
+            self.assertEqual(collection.latest_positioning_comment.content, "latest")
+        self.assertIsNone(
+            Collection.objects.with_positioning_comments().get(id=CollectionFactory().id).latest_positioning_comment
+        )
@@ -28,6 +28,20 @@ class ProjectModelTest(TenantTestCase):
     def test_project_str(self):
         self.assertEqual(str(self.project), "Test Project")
 
+    def test_is_active_follows_the_status(self):
+        self.assertFalse(self.project.is_active)
+        self.project.status = ProjectStatus.LAUNCHED
+        self.project.save()
+        self.assertTrue(self.project.is_active)
+        Project.objects.filter(pk=self.project.pk).update(status=ProjectStatus.ARCHIVED)
+        self.project.refresh_from_db()
+        self.assertFalse(self.project.is_active)
+
+    def test_delete_removes_project_libraries(self):
+        self.project.delete()
+        self.assertFalse(ProjectLibrary.objects.filter(library=self.library).exists())
+        self.assertTrue(Library.objects.filter(pk=self.library.pk).exists())
+
     def test_status_constraint(self):
         with self.assertRaises(IntegrityError):
             Project.objects.create(name="Invalid Status", status=9999)
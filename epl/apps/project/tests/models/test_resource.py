@@ -1,3 +1,4 @@
+from epl.apps.project.models import ResourceStatus
 from epl.apps.project.tests.factories.collection import CollectionFactory
 from epl.apps.project.tests.factories.library import LibraryFactory
 from epl.apps.project.tests.factories.project import ProjectFactory
@@ -26,3 +27,24 @@ class ResourceTurnsTest(TestCase):
             {"library": str(self.library_1.id), "collection": str(self.collection_3.id)},
         ]
         self.assertEqual(turns, expected_turns)
+
+    def test_next_turn_follows_status(self):
+        turns = self.resource.calculate_turns()
+        self.resource.instruction_turns["bound_copies"]["turns"] = turns[:1]
+        self.resource.instruction_turns["unbound_copies"]["turns"] = turns[1:]
+
+        self.resource.status = ResourceStatus.INSTRUCTION_BOUND
+        self.assertEqual(self.resource.next_turn, turns[0])
+        self.resource.status = ResourceStatus.CONTROL_BOUND
+        self.assertEqual(self.resource.next_turn, turns[1])
+        self.resource.status = ResourceStatus.POSITIONING
+        self.assertIsNone(self.resource.next_turn)
+
+    def test_next_turn_without_turns(self):
+        self.resource.status = ResourceStatus.INSTRUCTION_UNBOUND
+        self.assertIsNone(self.resource.next_turn)
+
+    def test_default_instruction_turns_are_not_shared(self):
+        other_resource = ResourceFactory(project=self.project)
+        self.resource.instruction_turns["bound_copies"]["turns"].append(self.resource.calculate_turns()[0])
+        self.assertListEqual(other_resource.instruction_turns["bound_copies"]["turns"], [])
@@ -1,4 +1,4 @@
-from epl.apps.project.models import AnomalyType, Role
+from epl.apps.project.models import Anomaly, AnomalyType, Role
 from epl.apps.project.permissions.anomaly import AnomalyPermissions
 from epl.apps.project.tests.factories.collection import CollectionFactory
 from epl.apps.project.tests.factories.library import LibraryFactory
@@ -6,6 +6,7 @@ from epl.apps.project.tests.factories.project import ProjectFactory
 from epl.apps.project.tests.factories.resource import ResourceFactory
 from epl.apps.project.tests.factories.segment import SegmentFactory
 from epl.apps.project.tests.factories.user import UserWithRoleFactory
+from epl.apps.user.models import User
 from epl.tests import TestCase
 
 
@@ -103,3 +104,22 @@ class AnomalyPermissionTests(TestCase):
         instructor = UserWithRoleFactory(role=Role.INSTRUCTOR, project=project1, library=library2)
 
         self.assertFalse(AnomalyPermissions.user_has_permission("fix", instructor, anomaly))
+
+    def test_destroy_only_loads_the_user_roles(self):
+        library = LibraryFactory()
+        project = ProjectFactory()
+        project.libraries.add(library)
+        resource = ResourceFactory(project=project)
+        collection = CollectionFactory(project=project, library=library, resource=resource)
+        segment = SegmentFactory(collection=collection)
+        instructor = UserWithRoleFactory(role=Role.INSTRUCTOR, project=project, library=library)
+        anomaly = segment.anomalies.create(type=AnomalyType.SEGMENT_OVERLAP, resource=resource, created_by=instructor)
+        UserWithRoleFactory(role=Role.PROJECT_ADMIN, project=project)
+
+        # Loaded like AnomalyViewSet does
+        anomaly = Anomaly.objects.select_related("segment__collection").get(pk=anomaly.pk)
+        admin = User.objects.get(project_roles__role=Role.PROJECT_ADMIN)
+        with self.assertNumQueries(1):
+            self.assertTrue(AnomalyPermissions.user_has_permission("destroy", admin, anomaly))
+        with self.assertNumQueries(0):
+            self.assertTrue(AnomalyPermissions.user_has_permission("destroy", instructor, anomaly))
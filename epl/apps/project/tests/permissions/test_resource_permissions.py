@@ -0,0 +1,30 @@
+from epl.apps.project.models import Resource, Role
+from epl.apps.project.permissions.resource import ResourcePermission
+from epl.apps.project.tests.factories.project import ProjectFactory
+from epl.apps.project.tests.factories.resource import ResourceFactory
+from epl.apps.project.tests.factories.user import UserWithRoleFactory
+from epl.apps.user.models import User
+from epl.tests import TestCase
+
+
+class ResourcePermissionTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.project = ProjectFactory()
+        self.resource = ResourceFactory(project=self.project)
+
+    def test_project_is_not_loaded_for_role_checks(self):
+        UserWithRoleFactory(role=Role.CONTROLLER, project=self.project)
+        controller = User.objects.get(project_roles__role=Role.CONTROLLER)
+        resource = Resource.objects.get(pk=self.resource.pk)
+
+        # Only the roles of the user are fetched, once
+        with self.assertNumQueries(1):
+            self.assertTrue(ResourcePermission.user_has_permission("validate_control", controller, resource))
+            self.assertTrue(ResourcePermission.user_has_permission("report_anomalies", controller, resource))
+            self.assertFalse(ResourcePermission.user_has_permission("reset_instruction", controller, resource))
+
+    def test_controller_of_another_project_cannot_validate_control(self):
+        controller = UserWithRoleFactory(role=Role.CONTROLLER, project=ProjectFactory())
+
+        self.assertFalse(ResourcePermission.user_has_permission("validate_control", controller, self.resource))
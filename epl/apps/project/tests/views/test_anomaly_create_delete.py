@@ -1,5 +1,7 @@
 from unittest.mock import patch
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django_tenants.urlresolvers import reverse
 
 from epl.apps.project.models import Anomaly, AnomalyType, Role
@@ -44,6 +46,23 @@ class CreateAnomalyTest(TestCase):
         self.assertEqual(response.data["fixed"], False)
         self.assertIsNotNone(response.data["created_at"])
         self.assertEqual(response.data["created_by"]["id"], str(other_instructor.id))
+        self.assertEqual(Anomaly.objects.get(pk=response.data["id"]).resource_id, self.resource.id)
+
+    def test_segment_is_loaded_once(self):
+        payload = {
+            "segment_id": str(self.segment.id),
+            "type": AnomalyType.CONFUSING_WORDING,
+        }
+        library2 = LibraryFactory()
+        self.project.libraries.add(library2)
+        other_instructor = UserWithRoleFactory(role=Role.INSTRUCTOR, project=self.project, library=library2)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.response_created(self.post(reverse("anomaly-list"), data=payload, user=other_instructor))
+
+        # Anomaly.full_clean() still checks the segment exists, but the row itself is only loaded once
+        segment_loads = [_q["sql"] for _q in queries if 'SELECT "project_segment"."id"' in _q["sql"]]
+        self.assertEqual(len(segment_loads), 1)
 
     def test_create_anomaly_checks_permission(self):
         with patch("epl.apps.project.views.anomaly.AnomalyPermissions.user_can_create_anomaly") as mock_permission:
@@ -1,3 +1,5 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django_tenants.urlresolvers import reverse
 
 from epl.apps.project.models import AnomalyType, Role
@@ -45,6 +47,20 @@ class FixAnomalyTest(TestCase):
         self.assertTrue(self.anomaly.fixed)
         self.assertEqual(str(self.anomaly.fixed_by.id), str(self.instructor.id))
 
+    def test_fix_does_not_validate_the_relations_again(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.patch(
+                reverse("anomaly-fix", kwargs={"pk": self.anomaly.id}),
+                user=self.instructor,
+            )
+        self.response_ok(response)
+        self.assertIsNotNone(response.data["fixed_at"])
+        self.assertFalse(any('FROM "project_resource"' in _q["sql"] for _q in queries))
+
+        self.anomaly.refresh_from_db()
+        self.assertTrue(self.anomaly.fixed)
+        self.assertIsNotNone(self.anomaly.fixed_at)
+
     def test_admin_can_fix_anomaly(self):
         admin = UserWithRoleFactory(role=Role.PROJECT_ADMIN, project=self.project)
         response = self.patch(
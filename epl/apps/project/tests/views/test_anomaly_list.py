@@ -1,3 +1,5 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django_tenants.urlresolvers import reverse
 
 from epl.apps.project.models import Role
@@ -70,3 +72,19 @@ class TestAnomalyList(TestCase):
         self.response_ok(response)
         self.assertEqual(len(response.data), 1)
         self.assertEqual(response.data[0]["id"], str(_anomaly1.id))
+
+    def test_list_anomaly_users(self):
+        fixer = UserWithRoleFactory(role=Role.INSTRUCTOR, project=self.project, library=self.library)
+        AnomalyFactory(resource=self.resource, segment=self.segment1, created_by=self.instructor, fixed_by=fixer)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.get(reverse("anomaly-list") + f"?resource={self.resource.id}", user=self.instructor)
+        self.response_ok(response)
+        self.assertEqual(response.data[0]["created_by"]["display_name"], str(self.instructor))
+        self.assertEqual(response.data[0]["fixed_by"]["email"], fixer.email)
+
+        # The users are read with the anomalies, without their password and settings
+        anomaly_query = next(_q["sql"] for _q in queries if 'FROM "project_anomaly"' in _q["sql"])
+        self.assertIn('"first_name"', anomaly_query)
+        self.assertNotIn('"settings"', anomaly_query)
+        self.assertNotIn('"password"', anomaly_query)
@@ -1,3 +1,4 @@
+import codecs
 from pathlib import Path
 from urllib.parse import urlencode
 from uuid import uuid4
@@ -9,7 +10,7 @@ from django_tenants.urlresolvers import reverse
 from django_tenants.utils import tenant_context
 from parameterized import parameterized
 
-from epl.apps.project.models import Collection, Role
+from epl.apps.project.models import Collection, Resource, Role
 from epl.apps.project.tests.factories.collection import CollectionFactory
 from epl.apps.project.tests.factories.library import LibraryFactory
 from epl.apps.project.tests.factories.project import ProjectFactory
@@ -213,6 +214,49 @@ class CollectionViewSetTest(TestCase):
         self.assertIn("csv_file", response.data)
         self.assertEqual(int(response.data["csv_file"][0]["row"]), 2)
 
+    def test_import_csv_reuses_existing_resources(self):
+        valid_csv_file_path = FIXTURES_BASE_PATH / "valid_collection.csv"
+        content = valid_csv_file_path.read_bytes()
+
+        for library in (self.library, LibraryFactory()):
+            data = {
+                "csv_file": SimpleUploadedFile(name="valid_collection.csv", content=content, content_type="text/csv"),
+                "library": library.id,
+                "project": self.project.id,
+            }
+            response = self.post(
+                reverse("collection-import_csv"), data=data, user=self.project_creator, format="multipart"
+            )
+            self.assertEqual(response.status_code, 200)
+
+        collections = Collection.objects.filter(project=self.project)
+        self.assertEqual(collections.count(), 2 * collections.filter(library=self.library).count())
+        self.assertEqual(
+            Resource.objects.filter(project=self.project).count(),
+            collections.filter(library=self.library).values("resource").distinct().count(),
+        )
+
+    def test_import_csv_with_byte_order_mark(self):
+        content = (FIXTURES_BASE_PATH / "valid_collection.csv").read_bytes()
+        data = {
+            "csv_file": SimpleUploadedFile(
+                name="valid_collection.csv", content=codecs.BOM_UTF8 + content, content_type="text/csv"
+            ),
+            "library": self.library.id,
+            "project": self.project.id,
+        }
+
+        response = self.post(reverse("collection-import_csv"), data=data, user=self.project_creator, format="multipart")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            Collection.objects.filter(project=self.project).count(), len(content.decode("utf-8").splitlines()) - 1
+        )
+        # Number of resources by number of collections imported for them
+        self.assertEqual(
+            sum(count * resources for count, resources in response.data.items()),
+            Collection.objects.filter(project=self.project).count(),
+        )
+
     def test_import_csv_with_invalid_issn(self):
         invalid_csv_file_path = FIXTURES_BASE_PATH / "invalid_issn_collection.csv"
 
@@ -1,3 +1,5 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django_tenants.urlresolvers import reverse
 from parameterized import parameterized
 
@@ -182,3 +184,27 @@ class ProjectListFilterTest(TestCase):
         self.response_ok(response)
         self.assertEqual(response.data["count"], 1)
         self.assertEqual(response.data["results"][0]["id"], str(public_project.id))
+
+    def test_roles_are_not_checked_per_project(self):
+        projects = [PublicLaunchedProjectFactory() for _ in range(2)]
+        user = UserWithRoleFactory(role=Role.PROJECT_ADMIN, project=projects[0])
+
+        with CaptureQueriesContext(connection) as queries:
+            self.response_ok(self.get(reverse("project-list"), user=user))
+        num_queries = len(queries)
+
+        for _ in range(3):
+            UserRole.objects.create(
+                user=user, project=PublicLaunchedProjectFactory(), role=Role.PROJECT_ADMIN, assigned_by=user
+            )
+        with CaptureQueriesContext(connection) as queries:
+            response = self.get(reverse("project-list"), user=user)
+        self.assertEqual(response.data["count"], 5)
+        self.assertEqual(len(queries), num_queries)
+
+    def test_invitations_are_not_loaded(self):
+        PublicLaunchedProjectFactory()
+
+        with CaptureQueriesContext(connection) as queries:
+            self.response_ok(self.get(reverse("project-list"), user=UserFactory()))
+        self.assertFalse(any('"invitations"' in query["sql"] for query in queries))
@@ -0,0 +1,41 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django_tenants.urlresolvers import reverse
+
+from epl.apps.project.models import Role
+from epl.apps.project.tests.factories.library import LibraryFactory
+from epl.apps.project.tests.factories.project import ProjectFactory
+from epl.apps.project.tests.factories.user import UserWithRoleFactory
+from epl.tests import TestCase
+
+
+class ProjectRetrieveTest(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.project = ProjectFactory()
+        self.admin = UserWithRoleFactory(role=Role.PROJECT_ADMIN, project=self.project)
+
+    def add_library_with_instructor(self):
+        library = LibraryFactory()
+        self.project.libraries.add(library)
+        UserWithRoleFactory(role=Role.INSTRUCTOR, project=self.project, library=library)
+        return library
+
+    def retrieve(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.get(reverse("project-detail", kwargs={"pk": self.project.id}), user=self.admin)
+        self.response_ok(response)
+        return response, len(queries)
+
+    def test_libraries_and_roles_are_loaded_in_bulk(self):
+        library = self.add_library_with_instructor()
+        response, num_queries = self.retrieve()
+        self.assertListEqual([_l["name"] for _l in response.data["libraries"]], [library.name])
+        self.assertEqual(len(response.data["roles"]), 2)
+
+        self.add_library_with_instructor()
+        self.add_library_with_instructor()
+        response, more_num_queries = self.retrieve()
+        self.assertEqual(len(response.data["libraries"]), 3)
+        self.assertEqual(len(response.data["roles"]), 4)
+        self.assertEqual(more_num_queries, num_queries)
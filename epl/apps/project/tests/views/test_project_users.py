@@ -1,9 +1,12 @@
 import uuid
+from datetime import timedelta
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django_tenants.urlresolvers import reverse
 from django_tenants.utils import tenant_context
 
-from epl.apps.project.models import Project, Role
+from epl.apps.project.models import Project, Role, UserRole
 from epl.apps.user.models import User
 from epl.tests import TestCase
 
@@ -40,6 +43,45 @@ class ProjectUsersTest(TestCase):
         self.assertEqual(response.data[0]["username"], self.user.username)
         self.assertEqual(response.data[0]["roles"], ["project_manager", "instructor"])
 
+    def test_roles_are_listed_in_assignment_order(self):
+        user = User.objects.create_user(username="ordered", email="ordered@eplouribousse.fr")
+        controller = self.project_two.user_roles.create(user=user, role=Role.CONTROLLER)
+        guest = self.project_two.user_roles.create(user=user, role=Role.GUEST)
+        # The role created last was assigned first
+        UserRole.objects.filter(pk=guest.pk).update(assigned_at=controller.assigned_at - timedelta(days=1))
+
+        url = reverse("project-users", kwargs={"pk": self.project_two.id})
+        response = self.get(url, user=self.admin)
+        self.response_ok(response)
+        self.assertEqual(response.data[0]["roles"], ["guest", "controller"])
+
+    def test_get_project_users_only_returns_roles_for_this_project(self):
+        self.project_two.user_roles.create(user=self.user, role=Role.GUEST)
+        other_user = User.objects.create_user(username="other", email="other@eplouribousse.fr")
+        self.project_two.user_roles.create(user=other_user, role=Role.CONTROLLER)
+
+        url = reverse("project-users", kwargs={"pk": self.project_one.id})
+
+        response = self.get(url, user=self.admin)
+        self.response_ok(response)
+        self.assertEqual(len(response.data), 1)
+        self.assertCountEqual(response.data[0]["roles"], ["project_manager", "instructor"])
+
+    def test_roles_are_aggregated_with_the_users(self):
+        url = reverse("project-users", kwargs={"pk": self.project_one.id})
+        with CaptureQueriesContext(connection) as queries:
+            self.response_ok(self.get(url, user=self.admin))
+        num_queries = len(queries)
+
+        for i in range(3):
+            user = User.objects.create_user(username=f"user{i}", email=f"user{i}@eplouribousse.fr")
+            self.project_one.user_roles.create(user=user, role=Role.GUEST)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.get(url, user=self.admin)
+        self.assertEqual(len(response.data), 4)
+        self.assertEqual(len(queries), num_queries)
+
     def test_project_not_found(self):
         """Test retrieving users for a non-existent project."""
 
@@ -1,3 +1,5 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django_tenants.urlresolvers import reverse
 from parameterized import parameterized
 
@@ -63,3 +65,43 @@ class ResourceCollectionsTest(TestCase):
             self.assertIn(str(self.collection2.id), collection_ids)
 
             self.assertNotIn(str(self.other_collection.id), collection_ids)
+
+    def test_latest_positioning_comment_per_collection(self):
+        user = UserWithRoleFactory(role=Role.INSTRUCTOR, project=self.project, library=self.library)
+        self.collection1.comments.create(subject="Positioning comment", content="first", author=user)
+        self.collection1.comments.create(subject="Positioning comment", content="latest", author=user)
+        self.collection1.comments.create(subject="Other comment", content="other", author=user)
+
+        url = reverse("resource-collections", args=[self.resource.id])
+        response = self.get(url, user=user)
+
+        comments = {_c["id"]: _c["comment_positioning"] for _c in response.data["collections"]}
+        self.assertEqual(comments[str(self.collection1.id)]["content"], "latest")
+        self.assertIsNone(comments[str(self.collection2.id)])
+
+    def test_positioning_comments_of_each_collection(self):
+        user = UserWithRoleFactory(role=Role.INSTRUCTOR, project=self.project, library=self.library)
+        self.collection1.comments.create(subject="Positioning comment", content="first", author=user)
+        self.collection2.comments.create(subject="Positioning comment", content="second", author=user)
+
+        url = reverse("resource-collections", args=[self.resource.id])
+        response = self.get(url, user=user)
+
+        comments = {_c["id"]: _c["comment_positioning"] for _c in response.data["collections"]}
+        self.assertEqual(comments[str(self.collection1.id)]["content"], "first")
+        self.assertEqual(comments[str(self.collection2.id)]["content"], "second")
+
+    def test_collection_acls_do_not_query_per_collection(self):
+        user = UserWithRoleFactory(role=Role.INSTRUCTOR, project=self.project, library=self.library)
+        url = reverse("resource-collections", args=[self.resource.id])
+
+        with CaptureQueriesContext(connection) as queries:
+            self.response_ok(self.get(url, user=user))
+        num_queries = len(queries)
+
+        for _ in range(3):
+            CollectionFactory(library=LibraryFactory(), project=self.project, resource=self.resource)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.get(url, user=user)
+        self.assertEqual(len(response.data["collections"]), 5)
+        self.assertEqual(len(queries), num_queries)
@@ -2,8 +2,11 @@ import uuid
 
 from django_tenants.urlresolvers import reverse
 from parameterized import parameterized
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
 
-from epl.apps.project.models import ProjectStatus, ResourceStatus, Role
+from epl.apps.project.filters.resource import ResourceFilter
+from epl.apps.project.models import Collection, ProjectStatus, ResourceStatus, Role
 from epl.apps.project.models.collection import Arbitration
 from epl.apps.project.tests.factories.collection import CollectionFactory
 from epl.apps.project.tests.factories.library import LibraryFactory
@@ -490,3 +493,184 @@ class FilterResourceOnStatusTest(TestCase):
             ]
         )
         self.assertListEqual(result_ids, expected_ids)
+
+    def test_unknown_project_returns_empty_list(self):
+        query_params = {
+            "project": uuid.uuid4(),
+            "status": [ResourceStatus.POSITIONING],
+        }
+        response = self.get(
+            self._get_url("resource-list", query_params=query_params),
+            user=self.instructor,
+        )
+        self.response_ok(response)
+        self.assertEqual(response.data["count"], 0)
+
+    @parameterized.expand(["library", "against"])
+    def test_malformed_uuid_param_is_rejected(self, param_name):
+        query_params = {
+            "project": self.project.id,
+            "library": self.library1.id,
+            "status": [ResourceStatus.POSITIONING],
+            param_name: "not-a-uuid",
+        }
+        response = self.get(
+            self._get_url("resource-list", query_params=query_params),
+            user=self.instructor,
+        )
+        self.response_bad_request(response)
+        self.assertIn(param_name, response.data)
+
+    @parameterized.expand(["library", "against"])
+    def test_unknown_library_is_rejected(self, param_name):
+        query_params = {
+            "project": self.project.id,
+            "library": self.library1.id,
+            "status": [ResourceStatus.POSITIONING],
+            param_name: uuid.uuid4(),
+        }
+        response = self.get(
+            self._get_url("resource-list", query_params=query_params),
+            user=self.instructor,
+        )
+        self.response_bad_request(response)
+        self.assertIn(param_name, response.data)
+
+    @parameterized.expand([("unknown_status", [999]), ("non_numeric_status", ["abc"]), ("mixed", [10, 999])])
+    def test_invalid_status_is_rejected(self, _name, statuses):
+        query_params = {
+            "project": self.project.id,
+            "status": statuses,
+        }
+        response = self.get(
+            self._get_url("resource-list", query_params=query_params),
+            user=self.instructor,
+        )
+        self.response_bad_request(response)
+        self.assertIn("status", response.data)
+
+    def test_against_library_without_collection_excludes_resource(self):
+        other_library = LibraryFactory()
+        query_params = {
+            "project": self.project.id,
+            "library": self.library1.id,
+            "against": other_library.id,
+            "status": [ResourceStatus.INSTRUCTION_BOUND],
+        }
+        response = self.get(
+            self._get_url("resource-list", query_params=query_params),
+            user=self.instructor,
+        )
+        self.response_ok(response)
+        self.assertEqual(response.data["count"], 0)
+
+    @parameterized.expand(["abc", " "])
+    def test_invalid_positioning_filter_is_rejected(self, positioning_filter):
+        query_params = {
+            "project": self.project.id,
+            "status": [ResourceStatus.POSITIONING],
+            "positioning_filter": positioning_filter,
+        }
+        response = self.get(
+            self._get_url("resource-list", query_params=query_params),
+            user=self.instructor,
+        )
+        self.response_bad_request(response)
+        self.assertIn("positioning_filter", response.data)
+
+    def test_list_query_params_are_ignored_on_retrieve(self):
+        url = reverse("resource-detail", kwargs={"pk": self.resource_positioning.id})
+        response = self.get(f"{url}?status[]=abc&library=not-a-uuid&positioning_filter=abc", user=self.instructor)
+        self.response_ok(response)
+        self.assertEqual(response.data["id"], str(self.resource_positioning.id))
+
+    def test_instruction_bound_only_matches_first_turn(self):
+        resource = ResourceFactory(project=self.project, status=ResourceStatus.INSTRUCTION_BOUND)
+        _c1 = CollectionFactory(library=self.library1, project=self.project, resource=resource)
+        _c2 = CollectionFactory(library=self.library2, project=self.project, resource=resource)
+        resource.instruction_turns = {
+            "bound_copies": {
+                "turns": [
+                    {"library": str(self.library2.id), "collection": str(_c2.id)},
+                    {"library": str(self.library1.id), "collection": str(_c1.id)},
+                ]
+            }
+        }
+        resource.save()
+
+        query_params = {
+            "project": self.project.id,
+            "status": [ResourceStatus.INSTRUCTION_BOUND],
+        }
+        result_ids = {}
+        for library in (self.library1, self.library2):
+            response = self.get(
+                self._get_url("resource-list", query_params={**query_params, "library": library.id}),
+                user=self.instructor,
+            )
+            self.response_ok(response)
+            result_ids[library.id] = [result["id"] for result in response.data["results"]]
+
+        self.assertNotIn(str(resource.id), result_ids[self.library1.id])
+        self.assertIn(str(resource.id), result_ids[self.library2.id])
+
+    def test_existing_library_ids_are_remembered_on_request(self):
+        request = Request(APIRequestFactory().get("/"))
+        unknown_id = uuid.uuid4()
+        with self.assertNumQueries(1):
+            existing_ids = ResourceFilter._get_existing_library_ids(request, {self.library1.id, unknown_id})
+        self.assertSetEqual(existing_ids, {self.library1.id})
+        with self.assertNumQueries(0):
+            existing_ids = ResourceFilter._get_existing_library_ids(request, {self.library1.id})
+        self.assertSetEqual(existing_ids, {self.library1.id})
+
+    def test_schema_parameters_are_not_shared_between_calls(self):
+        parameters = ResourceFilter().get_schema_operation_parameters(view=None)
+        parameters[0]["schema"]["pattern"] = "modified"
+        parameters[0]["name"] = "modified"
+        fresh_parameters = ResourceFilter().get_schema_operation_parameters(view=None)
+        self.assertNotEqual(fresh_parameters[0]["name"], "modified")
+        self.assertNotEqual(fresh_parameters[0]["schema"]["pattern"], "modified")
+
+    def test_against_same_library_is_same_as_library_only(self):
+        query_params = {
+            "project": self.project.id,
+            "library": self.library1.id,
+            "status": [ResourceStatus.INSTRUCTION_BOUND],
+        }
+        response = self.get(self._get_url("resource-list", query_params=query_params), user=self.instructor)
+        self.response_ok(response)
+        response_against = self.get(
+            self._get_url("resource-list", query_params={**query_params, "against": self.library1.id}),
+            user=self.instructor,
+        )
+        self.response_ok(response_against)
+        self.assertListEqual(
+            [result["id"] for result in response_against.data["results"]],
+            [result["id"] for result in response.data["results"]],
+        )
+
+    def test_should_position_uses_prefetched_collections(self):
+        positioned = self.resource_positioning.collections.get(library=self.library1)
+        positioned.position = 1
+        positioned.save()
+        for library_id in (str(self.library1.id), str(self.library1.id).upper()):
+            with self.subTest(library_id=library_id):
+                query_params = {
+                    "project": self.project.id,
+                    "library": library_id,
+                    "status": [ResourceStatus.POSITIONING],
+                }
+                response = self.get(
+                    self._get_url("resource-list", query_params=query_params),
+                    user=self.instructor,
+                )
+                self.response_ok(response)
+                should_position = {result["id"]: result["should_position"] for result in response.data["results"]}
+                self.assertFalse(should_position[str(self.resource_positioning.id)])
+                for resource_id, value in should_position.items():
+                    expected = Collection.objects.filter(
+                        resource_id=resource_id, library=self.library1, position=None, exclusion_reason=""
+                    ).exists()
+                    self.assertEqual(value, expected, resource_id)
+                self.assertIn(True, should_position.values())
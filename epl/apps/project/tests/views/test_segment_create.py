@@ -1,3 +1,5 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django_tenants.urlresolvers import reverse
 from parameterized import parameterized
 
@@ -68,6 +70,23 @@ class SegmentCreateTest(TestCase):
                 3,
             )
 
+    def test_resource_is_loaded_with_the_collection(self):
+        collection = self.segment1.collection
+        data = {
+            "content": "2010-2015",
+            "collection": collection.id,
+        }
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.post(
+                self._get_url("segment-list"),
+                data,
+                content_type="application/json",
+                user=self.instructor,
+            )
+        self.assertEqual(response.status_code, 201)
+        self.assertFalse(any('FROM "project_resource"' in _q["sql"] for _q in queries))
+
     def test_create_segment_with_after_segment(self):
         segment3 = SegmentFactory(collection=self.segment1.collection)
         collection = self.segment1.collection
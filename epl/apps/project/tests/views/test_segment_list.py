@@ -1,3 +1,5 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django_tenants.urlresolvers import reverse
 from parameterized import parameterized
 
@@ -67,6 +69,19 @@ class SegmentListTest(TestCase):
         self.assertEqual(response.data[1]["order"], 2)
         self.assertEqual(response.data[2]["order"], 3)
 
+    def test_segment_acls_do_not_query_per_segment(self):
+        url = self._get_url("segment-list", query_params={"resource_id": str(self.segment1.collection.resource.id)})
+        with CaptureQueriesContext(connection) as queries:
+            self.response_ok(self.get(url, user=self.instructor))
+        num_queries = len(queries)
+
+        SegmentFactory(collection=self.segment1.collection)
+        SegmentFactory(collection=self.segment1.collection)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.get(url, user=self.instructor)
+        self.assertEqual(len(response.data), 4)
+        self.assertEqual(len(queries), num_queries)
+
     def test_invalid_resource(self):
         response = self.get(
             self._get_url("segment-list", query_params={"resource_id": self.instructor.id}), user=self.instructor
@@ -70,7 +70,7 @@ from epl.schema_serializers import UnauthorizedSerializer
     ),
 )
 class AnomalyViewSet(mixins.ListModelMixin, mixins.CreateModelMixin, mixins.DestroyModelMixin, GenericViewSet):
-    queryset = Anomaly.objects.all().select_related("segment", "created_by", "fixed_by")
+    queryset = Anomaly.objects.all().select_related("segment__collection", "created_by", "fixed_by")
     serializer_class = AnomalySerializer
     permission_classes = [AnomalyPermissions]
     pagination_class = None
@@ -79,6 +79,10 @@ class AnomalyViewSet(mixins.ListModelMixin, mixins.CreateModelMixin, mixins.Dest
         queryset = super().filter_queryset(queryset)
 
         if self.action == "list":
+            # The nested users only render their names and email
+            queryset = queryset.defer(
+                "created_by__password", "created_by__settings", "fixed_by__password", "fixed_by__settings"
+            )
             if project := self.request.query_params.get("project"):
                 return queryset.filter(resource__project__id=project)
             if resource := self.request.query_params.get("resource"):
@@ -88,10 +92,17 @@ class AnomalyViewSet(mixins.ListModelMixin, mixins.CreateModelMixin, mixins.Dest
 
         return queryset
 
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.action == "create":
+            # The segment was already loaded to check the permissions
+            context.update({"segment": getattr(self, "_segment", None)})
+        return context
+
     def check_permissions(self, request):
         if self.action == "create":
-            _segment = Segment.objects.get(pk=request.data.get("segment_id"))
-            if not AnomalyPermissions.user_can_create_anomaly(request.user, _segment):
+            self._segment = Segment.objects.select_related("collection").get(pk=request.data.get("segment_id"))
+            if not AnomalyPermissions.user_can_create_anomaly(request.user, self._segment):
                 self.permission_denied(
                     request,
                     message=_("You do not have permission to create an anomaly for this segment."),
@@ -44,13 +44,20 @@ from epl.schema_serializers import UnauthorizedSerializer
     ),
 )
 class CollectionViewSet(mixins.ListModelMixin, mixins.DestroyModelMixin, GenericViewSet):
-    queryset = Collection.objects.select_related("resource").all()
+    queryset = Collection.objects.select_related("resource").order_by("resource__title")
     serializer_class = CollectionSerializer
     permission_classes = [CollectionPermission]
     pagination_class = PageNumberPagination
     filter_backends = [filters.SearchFilter, CollectionFilter]
     search_fields = ["title", "=code"]
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == "list":
+            # Only the resource code and title are listed, skip its JSON columns
+            queryset = queryset.defer("resource__instruction_turns", "resource__validations")
+        return queryset
+
     @extend_schema(
         tags=["collection"],
         summary="Import a collection",
@@ -283,7 +290,7 @@ class CollectionViewSet(mixins.ListModelMixin, mixins.DestroyModelMixin, Generic
         """
         collection = self.get_object()
         if request.method == "GET":
-            comment = collection.comments.filter(subject=_("Positioning comment")).order_by("-created_at").first()
+            comment = collection.latest_positioning_comment
             if not comment:
                 return Response({}, status=status.HTTP_404_NOT_FOUND)
             serializer = PositioningCommentSerializer(comment)
@@ -292,7 +299,7 @@ class CollectionViewSet(mixins.ListModelMixin, mixins.DestroyModelMixin, Generic
             # Pour POST, on crée. Pour PATCH, on modifie le dernier commentaire.
             comment = None
             if request.method == "PATCH":
-                comment = collection.comments.filter(subject=_("Positioning comment")).order_by("-created_at").first()
+                comment = collection.latest_positioning_comment
             serializer = PositioningCommentSerializer(
                 comment, data=request.data, context={"request": request}, partial=True
             )
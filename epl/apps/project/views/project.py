@@ -1,3 +1,4 @@
+from django.contrib.postgres.aggregates import ArrayAgg
 from django.db.models import Prefetch
 from django.utils.translation import gettext_lazy as _
 from drf_spectacular.types import OpenApiTypes
@@ -8,7 +9,7 @@ from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
 from epl.apps.project.filters.project import ProjectFilter
-from epl.apps.project.models import ActionLog, Project, ProjectStatus, Role, UserRole
+from epl.apps.project.models import ActionLog, Project, ProjectLibrary, ProjectStatus, Role, UserRole
 from epl.apps.project.permissions.project import ProjectAlertSettingsPermissions, ProjectPermissions
 from epl.apps.project.serializers.common import StatusListSerializer
 from epl.apps.project.serializers.project import (
@@ -110,7 +111,13 @@ class ProjectViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         queryset = super().get_queryset()
         if self.action == "list":
-            queryset = Project.objects.public_or_participant(user=self.request.user).distinct()
+            queryset = Project.objects.public_or_participant(user=self.request.user).lite().distinct()
+        elif self.action == "retrieve":
+            # The detail serializer renders the user of every role and every library
+            queryset = queryset.prefetch_related(
+                Prefetch("user_roles", queryset=UserRole.objects.select_related("user")),
+                Prefetch("projectlibrary_set", queryset=ProjectLibrary.objects.with_names()),
+            )
         return queryset
 
     def get_serializer_class(self):
@@ -132,11 +139,11 @@ class ProjectViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=["get"], url_path="users")
     def users(self, request, pk=None):
         project = self.get_object()
+        # Only the role names are needed: let the database group them by user
         users = (
             User.objects.active()
             .filter(project_roles__project=project)
-            .prefetch_related(Prefetch("project_roles", queryset=UserRole.objects.filter(project=project)))
-            .distinct()
+            .annotate(roles=ArrayAgg("project_roles__role", order_by="project_roles__assigned_at"))
         )
         serializer = ProjectUserSerializer(users, many=True)
         return Response(serializer.data)
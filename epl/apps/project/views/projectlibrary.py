@@ -50,7 +50,7 @@ class ProjectLibraryViewSet(
         },
     )
     def partial_update(self, request, project_pk: UUID = None, pk=None):
-        project_library = get_object_or_404(ProjectLibrary.objects.all(), project_id=project_pk, library_id=pk)
+        project_library = get_object_or_404(ProjectLibrary.objects.with_names(), project_id=project_pk, library_id=pk)
         self.check_object_permissions(self.request, project_library)
         project_library.is_alternative_storage_site = bool(request.data.get("is_alternative_storage_site"))
         project_library.save(update_fields=["is_alternative_storage_site"])
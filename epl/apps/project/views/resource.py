@@ -70,6 +70,21 @@ class ResourceViewSet(ListModelMixin, UpdateModelMixin, RetrieveModelMixin, Gene
         queryset = super().get_queryset()
 
         if self.action == "list":
+            # The serializer reads the project of each resource for the instruction checks and the ACL,
+            # and only the positioning state of its collections
+            queryset = (
+                queryset.select_related("project")
+                .prefetch_related(None)
+                .prefetch_related(
+                    models.Prefetch(
+                        "collections",
+                        queryset=Collection.objects.only(
+                            "id", "resource_id", "library_id", "position", "exclusion_reason"
+                        ),
+                    )
+                )
+            )
+
             # Annotate with count of collections and aggregated call numbers within the specified project
             project = self.request.query_params.get("project")
             queryset = queryset.annotate(
@@ -142,7 +157,7 @@ class ResourceViewSet(ListModelMixin, UpdateModelMixin, RetrieveModelMixin, Gene
                     segments__anomalies__fixed=False,
                 ),
             ),
-        ).all()
+        ).with_positioning_comments()
         serializer = ResourceWithCollectionsSerializer(
             {
                 "resource": resource,
@@ -67,7 +67,7 @@ from epl.schema_serializers import UnauthorizedSerializer
 )
 class SegmentViewSet(ListModelMixin, CreateModelMixin, UpdateModelMixin, DestroyModelMixin, GenericViewSet):
     http_method_names = ["get", "post", "patch", "delete"]
-    queryset = Segment.objects.all()
+    queryset = Segment.objects.select_related("collection")
     permission_classes = [SegmentPermissions]
     serializer_class = SegmentSerializer
     pagination_class = None
@@ -91,7 +91,8 @@ class SegmentViewSet(ListModelMixin, CreateModelMixin, UpdateModelMixin, Destroy
 
             try:
                 resource = Resource.objects.get(id=resource_id)
-                queryset = self._annotate_anomalies(resource.segments)
+                # The segment ACLs read the project and library ids of the collection
+                queryset = self._annotate_anomalies(resource.segments.select_related("collection"))
             except Resource.DoesNotExist:
                 raise exceptions.NotFound({"detail": _("Resource does not exist")})
 
@@ -115,11 +116,13 @@ class SegmentViewSet(ListModelMixin, CreateModelMixin, UpdateModelMixin, Destroy
 
         segments_to_update = Segment.objects.filter(collection__resource=collection.resource).order_by("order")
 
+        renumbered_segments = []
         for index, segment in enumerate(segments_to_update):
             new_order = index + 1
             if segment.order != new_order:
                 segment.order = new_order
-                segment.save(update_fields=["order"])
+                renumbered_segments.append(segment)
+        Segment.objects.bulk_update(renumbered_segments, ["order"])
 
     @extend_schema(
         tags=["segment"],
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.12 on 2026-10-17 08:02
+
+import epl.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tenant", "0003_rename_settings_consortium_tenant_settings"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="consortium",
+            name="id",
+            field=models.UUIDField(
+                default=epl.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="domain",
+            name="id",
+            field=models.UUIDField(
+                default=epl.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+    ]
@@ -1,4 +1,6 @@
+from functools import cached_property
 from typing import Self, TypeVar
+from uuid import UUID
 
 from django.contrib.auth.models import AbstractUser, UserManager
 from django.db import IntegrityError, models
@@ -10,6 +12,14 @@ from epl.models import UUIDPrimaryKeyField
 T = TypeVar("T")
 
 
+def _to_uuid(value: models.Model | UUID | str | None) -> UUID | None:
+    if value is None or isinstance(value, UUID):
+        return value
+    if isinstance(value, models.Model):
+        return value.pk
+    return UUID(str(value))
+
+
 class UserQuerySet(models.QuerySet):
     def active(self):
         return self.filter(is_active=True)
@@ -58,31 +68,55 @@ class User(AbstractUser):
     def preferred_language(self) -> str | None:
         return self.settings.get("locale")
 
+    @cached_property
+    def role_set(self) -> frozenset[tuple[UUID | None, UUID | None, str]]:
+        # (project_id, library_id, role) for every role of the user, loaded once per instance.
+        # request.user is a fresh instance on each request, so this is effectively a per-request cache.
+        if self.pk is None:
+            return frozenset()
+        return frozenset(UserRole.objects.filter(user=self).values_list("project_id", "library_id", "role"))
+
+    def clear_role_cache(self) -> None:
+        self.__dict__.pop("role_set", None)
+
+    def has_role(self, role: Role, project: Project | UUID | str | None = None, library=None) -> bool:
+        project_id = _to_uuid(project)
+        if library is not None:
+            return (project_id, _to_uuid(library), str(role)) in self.role_set
+        return any(r_project_id == project_id and r_role == role for r_project_id, _, r_role in self.role_set)
+
+    def roles_in(self, project: Project | UUID | str) -> frozenset[str]:
+        project_id = _to_uuid(project)
+        return frozenset(role for r_project_id, _, role in self.role_set if r_project_id == project_id)
+
     @property
     def is_project_creator(self) -> bool:
-        return UserRole.objects.filter(user=self, role=Role.PROJECT_CREATOR).exists()
+        return any(role == Role.PROJECT_CREATOR for _, _, role in self.role_set)
 
-    def is_project_admin(self, project: Project | None, search_for_any: bool = False) -> bool:
+    @property
+    def can_manage_libraries(self) -> bool:
+        # Superusers, project creators and administrators of any project
+        return self.is_superuser or any(
+            role in (Role.PROJECT_CREATOR, Role.PROJECT_ADMIN) for _, _, role in self.role_set
+        )
+
+    def is_project_admin(self, project: Project | UUID | None, search_for_any: bool = False) -> bool:
         if search_for_any:
-            return UserRole.objects.filter(user=self, role=Role.PROJECT_ADMIN).exists()
-        return UserRole.objects.filter(user=self, project=project, role=Role.PROJECT_ADMIN).exists()
+            return any(role == Role.PROJECT_ADMIN for _, _, role in self.role_set)
+        return self.has_role(Role.PROJECT_ADMIN, project)
 
     def is_project_manager(self, project: Project) -> bool:
-        return UserRole.objects.filter(user=self, project=project, role=Role.PROJECT_MANAGER).exists()
+        return self.has_role(Role.PROJECT_MANAGER, project)
 
-    def is_controller(self, project: Project) -> bool:
-        return UserRole.objects.filter(user=self, project=project, role=Role.CONTROLLER).exists()
+    def is_controller(self, project: Project | UUID) -> bool:
+        return self.has_role(Role.CONTROLLER, project)
 
-    def is_instructor(self, project: Project, library: Library | str = None) -> bool:
+    def is_instructor(self, project: Project | UUID, library: Library | UUID | str = None) -> bool:
         # library is optional so we can check if user is Instructor in the project, without needing to give a library
-        queryset = UserRole.objects.filter(user=self, project=project, role=Role.INSTRUCTOR)
-        if library is not None:
-            filter_kwargs = {"library_id": library} if isinstance(library, str) else {"library": library}
-            queryset = queryset.filter(**filter_kwargs)
-        return queryset.exists()
+        return self.has_role(Role.INSTRUCTOR, project, library)
 
     def is_guest(self, project: Project) -> bool:
-        return UserRole.objects.filter(user=self, project=project, role=Role.GUEST).exists()
+        return self.has_role(Role.GUEST, project)
 
     def set_is_project_creator(self, value: bool, assigned_by: Self) -> None:
         if value:
@@ -92,3 +126,4 @@ class User(AbstractUser):
                 pass  # Role already exists
         else:
             UserRole.objects.filter(user=self, role=Role.PROJECT_CREATOR).delete()
+        self.clear_role_cache()
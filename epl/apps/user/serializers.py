@@ -16,6 +16,7 @@ from rest_framework_simplejwt.tokens import RefreshToken, Token
 from epl.apps.project.models import ActionLog, Project, ProjectStatus, Role, UserRole
 from epl.apps.user.models import User
 from epl.libs.schema import load_json_schema
+from epl.libs.serializers import RepresentationCacheMixin
 from epl.services.user.email import (
     send_account_created_email,
     send_invite_project_admins_to_review_email,
@@ -226,7 +227,7 @@ class ProjectUserSerializer(serializers.ModelSerializer):
         fields = ["id", "email", "first_name", "last_name", "roles", "is_superuser"]
 
 
-class NestedUserSerializer(serializers.ModelSerializer):
+class NestedUserSerializer(RepresentationCacheMixin, serializers.ModelSerializer):
     display_name = serializers.SerializerMethodField(help_text=_("User's display name"))
 
     class Meta:
@@ -398,7 +399,7 @@ class CreateAccountFromTokenSerializer(serializers.Serializer):
 
                         # Validate library exists if library_id is provided
                         if library_id:
-                            if not project.libraries.filter(id=library_id).exists():
+                            if not project.projectlibrary_set.filter(library_id=library_id).exists():
                                 raise serializers.ValidationError(
                                     _("The library associated with this invitation no longer exists.")
                                 )
@@ -473,9 +474,7 @@ class UserAlertSettingsSerializer(serializers.Serializer):
     )
 
     def validate_project_id(self, value):
-        try:
-            Project.objects.get(id=value)
-        except Project.DoesNotExist:
+        if not Project.objects.filter(id=value).exists():
             raise serializers.ValidationError(_("Project does not exist."))
         return value
 
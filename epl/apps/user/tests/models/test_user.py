@@ -158,3 +158,29 @@ class IsInstructorForTest(TestCase):
             assigned_by=self.assigner,
         )
         self.assertFalse(self.user.is_instructor(self.project1, self.library1))
+
+    def test_roles_are_loaded_once_per_user_instance(self):
+        UserRole.objects.create(
+            user=self.user,
+            role=Role.INSTRUCTOR,
+            project=self.project1,
+            library=self.library1,
+            assigned_by=self.assigner,
+        )
+        self.user.is_instructor(self.project1)
+        with self.assertNumQueries(0):
+            self.assertTrue(self.user.is_instructor(self.project1, str(self.library1.id)))
+            self.assertFalse(self.user.is_controller(self.project1))
+            self.assertFalse(self.user.is_project_admin(self.project1))
+
+    def test_role_cache_is_cleared_when_a_role_is_added(self):
+        self.assertFalse(self.user.is_controller(self.project1))
+        UserRole.objects.create(user=self.user, role=Role.CONTROLLER, project=self.project1, assigned_by=self.assigner)
+        self.assertTrue(self.user.is_controller(self.project1))
+
+    def test_project_admin_can_manage_libraries(self):
+        self.assertFalse(self.user.can_manage_libraries)
+        UserRole.objects.create(
+            user=self.user, role=Role.PROJECT_ADMIN, project=self.project2, assigned_by=self.assigner
+        )
+        self.assertTrue(self.user.can_manage_libraries)
@@ -1,10 +1,10 @@
 import json
-import uuid
 from typing import Annotated, Any, TypedDict
 from uuid import UUID
 
 from pydantic import BaseModel, Field, ValidationError, field_validator
 
+from epl.models import uuid7
 from epl.validators import IssnValidator
 
 
@@ -47,7 +47,7 @@ class ResourceModel(BaseModel):
     def validate_issn(cls, value: str) -> str:
         if not value:
             return ""
-        value = value.strip().upper()
+        value = value.strip()
         try:
             value = IssnValidator()(value)
         except Exception:
@@ -78,10 +78,11 @@ def handle_import(
         numbering = row.pop("Numerotation", "").strip()  # Non disponible dans les fichiers actuels
         publication_history = row.pop("PublieEn", "").strip().split(",", 1)[0]
 
-        if not codes.get(ppn):
+        code = codes.get(ppn)
+        if not code:
             try:
                 resource = ResourceModel(
-                    id=uuid.uuid4(),
+                    id=uuid7(),
                     code=ppn,
                     title=titre,
                     issn=issn,
@@ -89,19 +90,19 @@ def handle_import(
                     numbering=numbering,
                     project_id=project_id,
                 )
-                codes[ppn] = {"id": resource.id, "count": 1}
+                code = codes[ppn] = {"id": resource.id, "count": 1}
                 resources.append(resource)
             except ValidationError as e:
                 errors.append((row_number, json.loads(e.json())))
                 continue
         else:
-            codes[ppn]["count"] += 1
+            code["count"] += 1
 
         try:
             collections.append(
                 CollectionModel(
                     **row,
-                    resource_id=codes.get(ppn)["id"],
+                    resource_id=code["id"],
                     created_by_id=created_by,
                     project_id=project_id,
                     library_id=library_id,
@@ -0,0 +1,24 @@
+from rest_framework import serializers
+
+
+class RepresentationCacheMixin(serializers.Serializer):
+    """
+    Render each instance only once per serialization.
+
+    The representations are kept in the context shared by the root serializer and its
+    nested serializers, keyed by serializer class and primary key. Use it on read-only
+    nested serializers whose instances are repeated in a response (e.g. the same user
+    holding several roles).
+    """
+
+    representation_cache_key = "_representation_cache"
+
+    def to_representation(self, instance):
+        if getattr(instance, "pk", None) is None:
+            return super().to_representation(instance)
+
+        cache = self.context.setdefault(self.representation_cache_key, {})
+        key = (type(self), instance.pk)
+        if key not in cache:
+            cache[key] = super().to_representation(instance)
+        return cache[key]
@@ -1,8 +1,27 @@
+import os
+import time
 import uuid
 from functools import partial
 
 from django.db import models
 
-UUIDPrimaryKeyField = partial(models.UUIDField, primary_key=True, default=uuid.uuid4, editable=False)
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (version 7, RFC 9562).
+    The leading millisecond timestamp keeps new primary keys close to each other in btree indexes.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand_a, rand_b = divmod(int.from_bytes(os.urandom(10)), 1 << 68)
+    return uuid.UUID(
+        int=(timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | (rand_a & 0xFFF) << 64
+        | 0b10 << 62
+        | (rand_b & 0x3FFF_FFFF_FFFF_FFFF)
+    )
+
+
+UUIDPrimaryKeyField = partial(models.UUIDField, primary_key=True, default=uuid7, editable=False)
 CreatedAtField = partial(models.DateTimeField, auto_now_add=True, editable=False)
 UpdatedAtField = partial(models.DateTimeField, auto_now=True)
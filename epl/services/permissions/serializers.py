@@ -6,13 +6,13 @@ from rest_framework.permissions import BasePermission
 
 
 class AclSerializerMixin(serializers.Serializer):
-    base_permissions = [
+    base_permissions = (
         "retrieve",
         "update",
         "partial_update",
         "destroy",
-    ]
-    extended_permissions = []
+    )
+    extended_permissions = ()
 
     def get_acl(self, instance) -> dict[str, bool]:
         acl_field = self.fields["acl"]
@@ -20,7 +20,14 @@ class AclSerializerMixin(serializers.Serializer):
         exclude = getattr(acl_field, "exclude", [])
         include = getattr(acl_field, "include", [])
         permissions = self._get_permissions(instance, include=include, exclude=exclude)
-        permission_classes = self._get_permission_classes(permission_classes=custom_permission_classes)
+        if "_acl_permission_classes" not in self.__dict__:
+            # Resolved once per serializer, a list serializer renders the ACL of every instance
+            self._acl_permission_classes = [
+                permission_class
+                for permission_class in self._get_permission_classes(permission_classes=custom_permission_classes)
+                if callable(getattr(permission_class, "user_has_permission", None))
+            ]
+        permission_classes = self._acl_permission_classes
         user = self.context["request"].user
         return {
             permission: self._check_permission(
@@ -35,12 +42,10 @@ class AclSerializerMixin(serializers.Serializer):
     @staticmethod
     def _check_permission(permission_classes, permission, user, instance) -> bool:
         """
-        Check the permission on each permission class
+        Check the permission on each permission class providing user_has_permission
         """
         return any(
-            permission_class.user_has_permission(permission, user, instance)
-            for permission_class in permission_classes
-            if hasattr(permission_class, "user_has_permission") and callable(permission_class.user_has_permission)
+            permission_class.user_has_permission(permission, user, instance) for permission_class in permission_classes
         )
 
     def _get_permissions(
@@ -50,13 +55,23 @@ class AclSerializerMixin(serializers.Serializer):
         Get all permissions: base_permissions and extended_permissions that
         can be defined on the model's Meta class
         """
+        # A list serializer asks for every instance, the answer only depends on the model and the arguments
+        cache = self.__dict__.setdefault("_permissions_cache", {})
+        key = (instance.__class__, tuple(include or ()), tuple(exclude or ()))
+        if key not in cache:
+            cache[key] = self._compute_permissions(instance.__class__, include=include, exclude=exclude)
+        return list(cache[key])
+
+    def _compute_permissions(
+        self, model_class: type[models.Model], include: list[str] = None, exclude: list[str] = None
+    ) -> list[str]:
         extended_permissions = getattr(
-            instance.__class__,
+            model_class,
             "_extended_permissions",
-            [],
+            (),
         )
         # All permissions defined on the model
-        permissions = list(set(self.base_permissions + extended_permissions))
+        permissions = list({*self.base_permissions, *extended_permissions})
 
         if include:
             # If include is defined, return only those permissions
@@ -79,6 +79,16 @@ class AclSerializerMixinTest(TestCase):
             sorted(["retrieve", "update", "partial_update", "destroy"]),
         )
 
+    def test_get_permissions_is_computed_once_per_model(self):
+        with patch.object(
+            TestSerializer, "_compute_permissions", autospec=True, return_value=["retrieve"]
+        ) as compute_permissions:
+            self.serializer._get_permissions(TestModel())
+            permissions = self.serializer._get_permissions(TestModel())
+            self.serializer._get_permissions(TestModelWithoutExtendedPermissions())
+        self.assertListEqual(permissions, ["retrieve"])
+        self.assertEqual(compute_permissions.call_count, 2)
+
     def test_get_permission_classes(self):
         permission_classes = self.serializer._get_permission_classes()
         self.assertListEqual(
@@ -113,3 +123,12 @@ class AclSerializerMixinTest(TestCase):
             user_has_permission.call_count,
             5,
         )
+
+    def test_get_acl_resolves_permission_classes_once(self):
+        with patch.object(
+            TestSerializer, "_get_permission_classes", autospec=True, return_value=[TestPermissionClass, object]
+        ) as get_permission_classes:
+            self.serializer.get_acl(TestModel())
+            acls = self.serializer.get_acl(TestModel())
+        self.assertTrue(all(acls.values()))
+        self.assertEqual(get_permission_classes.call_count, 1)
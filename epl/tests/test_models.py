@@ -0,0 +1,18 @@
+import uuid
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from epl.models import uuid7
+
+
+class Uuid7Test(SimpleTestCase):
+    def test_version_and_variant(self):
+        value = uuid7()
+        self.assertEqual(value.version, 7)
+        self.assertEqual(value.variant, uuid.RFC_4122)
+
+    def test_ordered_by_time(self):
+        with mock.patch("epl.models.time.time_ns", side_effect=[1_000_000_000, 2_000_000_000]):
+            first, second = uuid7(), uuid7()
+        self.assertLess(first, second)
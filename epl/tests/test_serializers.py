@@ -0,0 +1,27 @@
+from unittest import mock
+
+from rest_framework import serializers
+
+from epl.apps.project.tests.factories.user import UserFactory
+from epl.apps.user.serializers import NestedUserSerializer
+from epl.tests import TestCase
+
+
+class UsersSerializer(serializers.Serializer):
+    users = NestedUserSerializer(many=True)
+
+
+class RepresentationCacheMixinTest(TestCase):
+    def test_repeated_instance_is_rendered_once(self):
+        user, other_user = UserFactory(), UserFactory()
+        with mock.patch.object(NestedUserSerializer, "get_display_name", return_value="name") as get_display_name:
+            data = UsersSerializer({"users": [user, other_user, user]}).data
+
+        self.assertEqual(get_display_name.call_count, 2)
+        self.assertListEqual([_u["id"] for _u in data["users"]], [str(user.id), str(other_user.id), str(user.id)])
+
+    def test_cache_is_not_shared_between_serializations(self):
+        user = UserFactory(first_name="Before")
+        self.assertEqual(NestedUserSerializer(user).data["first_name"], "Before")
+        user.first_name = "After"
+        self.assertEqual(NestedUserSerializer(user).data["first_name"], "After")
@@ -52,6 +52,11 @@ class IssnValidatorTest(TestCase):
         with self.assertRaises(serializers.ValidationError):
             IssnValidator()("1234-5678")
 
+    def test_non_digit_issn_raises_validation_error(self):
+        for value in ("ABCD-124X", "1050-12X4", "１０５０-124X"):
+            with self.subTest(value=value), self.assertRaises(serializers.ValidationError):
+                IssnValidator()(value)
+
     def test_issn_must_be_8_chars(self):
         with self.assertRaises(serializers.ValidationError):
             IssnValidator()("123")
@@ -64,6 +69,10 @@ class IssnValidatorTest(TestCase):
         validated_value = IssnValidator()("1050-124x")
         self.assertEqual(validated_value, "1050-124X")
 
+    def test_spaces_are_ignored(self):
+        validated_value = IssnValidator()("1050 124x")
+        self.assertEqual(validated_value, "1050-124X")
+
 
 class JSONSchemaWithRefValidatorTest(TestCase):
     def test_project_settings_schema_with_ref_resolution(self):
@@ -9,8 +9,6 @@ from jsonschema import Draft202012Validator
 from jsonschema.exceptions import ValidationError as SchemaValidationError
 from referencing import Registry, Resource
 from rest_framework import serializers
-from stdnum import issn
-from stdnum.exceptions import ValidationError as StdValidationError
 
 
 class JSONSchemaValidator:
@@ -55,12 +53,19 @@ class IssnValidator:
     Validate that the given ISSN is valid and format uppercase with - separator
     """
 
+    check_characters = "0123456789X"
+    # Drops the separators and uppercases the check character in one pass, any other letter is invalid anyway
+    normalization_table = str.maketrans({"-": None, " ": None, "x": "X"})
+
     def __call__(self, value: str) -> str:
-        issn_to_check = value.replace("-", "").replace(" ", "").upper()
+        issn_to_check = value.translate(self.normalization_table)
         if len(issn_to_check) != 8:
             raise serializers.ValidationError(_("ISSN must be 8 characters long"))
-        try:
-            issn.validate(issn_to_check)
-        except StdValidationError as e:
-            raise serializers.ValidationError(f"Invalid ISSN {str(e)}")
+        digits, check = issn_to_check[:7], issn_to_check[7]
+        if not (digits.isascii() and digits.isdigit()) or check not in self.check_characters:
+            raise serializers.ValidationError(_("Invalid ISSN format"))
+        # Weights 8 to 2 on the digits, the check character completes the sum to a multiple of 11
+        total = sum(weight * int(digit) for weight, digit in zip(range(8, 1, -1), digits))
+        if (total + self.check_characters.index(check)) % 11:
+            raise serializers.ValidationError(_("Invalid ISSN checksum"))
         return f"{issn_to_check[:4]}-{issn_to_check[4:]}"